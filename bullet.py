@@ -5,7 +5,14 @@ Handles player projectiles that damage enemies.
 
 import pygame
 
-class Bullet(pygame.sprite.Sprite):
+class Bullet:
+    # Plain class with slots: bullets are kept in a plain list, not a sprite group
+    __slots__ = ('width', 'height', 'image', 'rect', 'direction', 'speed', 'damage', 'active')
+    
+    # Shared images for every bullet, built once on first use (see load_images)
+    _IMAGE_RIGHT = None
+    _IMAGE_LEFT = None
+    
     def __init__(self, x, y, direction):
         """Initialize a bullet.
         
@@ -14,15 +21,15 @@ class Bullet(pygame.sprite.Sprite):
             y: Starting y position
             direction: -1 for left, 1 for right
         """
-        super().__init__()
-        
         # Bullet dimensions
         self.width = 20
         self.height = 16
         
-        # Create bullet surface (teardrop rotated 90 degrees counterclockwise)
-        self.image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        self.draw_bullet()
+        # All bullets look identical, so they share one surface per direction
+        # (normally preloaded by the game right after the display is created)
+        if Bullet._IMAGE_RIGHT is None:
+            Bullet.load_images(self.width, self.height)
+        self.image = Bullet._IMAGE_LEFT if direction < 0 else Bullet._IMAGE_RIGHT
         
         # Position and movement
         self.rect = self.image.get_rect()
@@ -35,23 +42,41 @@ class Bullet(pygame.sprite.Sprite):
         self.damage = 1
         self.active = True
     
-    def draw_bullet(self):
+    @classmethod
+    def load_images(cls, width=20, height=16):
+        """Build the shared right- and left-facing bullet images.
+        
+        Must be called after pygame.display.set_mode so the surfaces can be
+        converted to the display format.
+        """
+        # Create bullet surface (teardrop rotated 90 degrees counterclockwise)
+        image = pygame.Surface((width, height), pygame.SRCALPHA)
+        cls.draw_bullet(image)
+        
+        # Pre-compute both orientations so draw() never flips per frame
+        cls._IMAGE_RIGHT = image.convert_alpha()
+        cls._IMAGE_LEFT = pygame.transform.flip(image, True, False).convert_alpha()
+    
+    @staticmethod
+    def draw_bullet(surface):
         """Draw a teardrop shape rotated 90 degrees counterclockwise (pointing right)."""
+        width, height = surface.get_size()
+        
         # Teardrop pointing right (for right-facing bullets)
         # Points form a teardrop: rounded back, pointed front
         points = [
-            (2, self.height // 2),           # Back left
-            (4, 2),                           # Top curve
-            (self.width // 2, 1),             # Top mid
-            (self.width - 2, self.height // 2), # Tip (point)
-            (self.width // 2, self.height - 1), # Bottom mid
-            (4, self.height - 2)              # Bottom curve
+            (2, height // 2),           # Back left
+            (4, 2),                      # Top curve
+            (width // 2, 1),             # Top mid
+            (width - 2, height // 2),    # Tip (point)
+            (width // 2, height - 1),    # Bottom mid
+            (4, height - 2)              # Bottom curve
         ]
         
         # Draw filled bullet (bright yellow/orange)
-        pygame.draw.polygon(self.image, (255, 200, 0), points)
+        pygame.draw.polygon(surface, (255, 200, 0), points)
         # Draw outline for definition
-        pygame.draw.polygon(self.image, (200, 150, 0), points, 2)
+        pygame.draw.polygon(surface, (200, 150, 0), points, 2)
     
     def update(self, level_width, level_height):
         """Update bullet position and check if it's out of bounds."""
@@ -64,19 +89,43 @@ class Bullet(pygame.sprite.Sprite):
         if self.rect.bottom < 0 or self.rect.top > level_height:
             self.active = False
     
+    @classmethod
+    def update_all(cls, bullets, level_width, level_height):
+        """Advance every bullet by one frame and return those still active.
+
+        Does the work of update() for the whole list in one loop, so callers
+        can replace the list instead of removing dead bullets one at a time.
+        """
+        alive = []
+        append = alive.append
+        for bullet in bullets:
+            rect = bullet.rect
+            rect.x += bullet.speed * bullet.direction
+            
+            # Deactivate if out of bounds
+            if (rect.right < 0 or rect.left > level_width or
+                    rect.bottom < 0 or rect.top > level_height):
+                bullet.active = False
+            elif bullet.active:
+                append(bullet)
+        return alive
+    
     def draw(self, screen, camera_x=0, camera_y=0):
         """Draw the bullet to the screen with camera offset."""
         if not self.active:
             return
         
-        # Flip image if shooting left
-        if self.direction < 0:
-            flipped_image = pygame.transform.flip(self.image, True, False)
-            screen_pos = (self.rect.x - camera_x, self.rect.y - camera_y)
-            screen.blit(flipped_image, screen_pos)
-        else:
-            screen_pos = (self.rect.x - camera_x, self.rect.y - camera_y)
-            screen.blit(self.image, screen_pos)
+        # Image already faces the direction of travel
+        screen_pos = (self.rect.x - camera_x, self.rect.y - camera_y)
+        screen.blit(self.image, screen_pos)
+    
+    @classmethod
+    def get_all_blit_items(cls, bullets, camera_x=0, camera_y=0):
+        """Return the blit sequence for all active bullets."""
+        return [
+            (bullet.image, (bullet.rect.x - camera_x, bullet.rect.y - camera_y))
+            for bullet in bullets if bullet.active
+        ]
     
     def get_rect(self):
         """Return the bullet's rectangle for collision detection."""
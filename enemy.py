@@ -6,23 +6,63 @@ Base Enemy class with inheritance for different enemy types.
 import pygame
 import random
 import math
+from math import hypot, sqrt
+from itertools import chain
 
-class Enemy(pygame.sprite.Sprite):
+# Private generator for enemy behavior rolls; avoids the module-level
+# random functions and can be seeded on its own
+_RNG = random.Random()
+
+class Enemy:
     """Base enemy class with common functionality."""
     
+    # Plain class with slots: enemies live in plain lists, so sprite group
+    # bookkeeping is never needed
+    __slots__ = ('width', 'height', 'image', 'rect', 'speed', 'health', 'max_health',
+                 'damage', 'color', 'direction', 'velocity_x', 'velocity_y', 'gravity',
+                 'max_fall_speed', 'on_ground', 'active', 'pos_x', 'pos_y')
+    
+    # True when a class overrides get_movement_behavior (set by __init_subclass__)
+    has_custom_movement = False
+    
+    # True when update() takes the player's position as an extra argument
+    uses_player_position = False
+    
+    # True when the enemy draws projectiles that may be on screen while it is not
+    has_projectiles = False
+    
+    # Pre-rendered health bars keyed by (bar width, filled width)
+    _hp_bar_cache = {}
+    
+    # Blank body surfaces in display format keyed by (width, height, color)
+    _image_cache = {}
+    
+    # Body-plus-eye surfaces keyed by (image size, enemy width, color,
+    # (facing_right, vy_sign)); shared between enemies and never drawn on
+    # after creation
+    _sprite_cache = {}
+    
+    # Eye offset from its resting spot keyed by (facing_right, vy_sign):
+    # 6px towards the facing side, and 6px up or down while jumping or falling
+    _EYE_OFFSETS = {
+        (True, -1): (6, -6), (True, 0): (6, 0), (True, 1): (6, 6),
+        (False, -1): (-6, -6), (False, 0): (-6, 0), (False, 1): (-6, 6),
+    }
+    
+    def __init_subclass__(cls, **kwargs):
+        """Record once per class whether update() needs to call the movement hook."""
+        super().__init_subclass__(**kwargs)
+        cls.has_custom_movement = cls.get_movement_behavior is not Enemy.get_movement_behavior
+    
     def __init__(self, x, y):
         """Initialize the base enemy."""
-        super().__init__()
-        
         # Default dimensions (can be overridden by subclasses)
         self.width = 32
         self.height = 32
         
-        # Create enemy surface and rectangle
-        self.image = pygame.Surface((self.width, self.height))
-        self.rect = self.image.get_rect()
-        self.rect.x = x
-        self.rect.y = y
+        # Create enemy rectangle; the image comes from create_visual once the
+        # subclass has set its size and color
+        self.rect = pygame.Rect(x, y, self.width, self.height)
         
         # Default properties (should be overridden by subclasses)
         self.speed = 1
@@ -47,6 +87,10 @@ class Enemy(pygame.sprite.Sprite):
         # Setup this specific enemy type
         self.setup_properties()
         self.create_visual()
+        
+        # Sub-pixel position; rect holds the rounded value used for drawing and collision
+        self.pos_x = float(self.rect.x)
+        self.pos_y = float(self.rect.y)
     
     def setup_properties(self):
         """Set up enemy-specific properties. Override in subclasses."""
@@ -54,121 +98,205 @@ class Enemy(pygame.sprite.Sprite):
     
     def create_visual(self):
         """Create the visual representation. Override in subclasses."""
-        # Store current position before creating new rect
-        old_x = self.rect.x if hasattr(self, 'rect') else 0
-        old_y = self.rect.y if hasattr(self, 'rect') else 0
+        # Shared blank body, already in display format for fast blits
+        self.image = Enemy.get_body_image(self.width, self.height, self.color)
         
-        self.image = pygame.Surface((self.width, self.height))
-        self.image.fill(self.color)
-        self.rect = self.image.get_rect()
-        
-        # Restore position after creating new rect
-        self.rect.x = old_x
-        self.rect.y = old_y
+        # Keep the existing rect (and position) unless the size changed
+        if self.rect.size != (self.width, self.height):
+            self.rect = pygame.Rect(self.rect.x, self.rect.y, self.width, self.height)
         
         # Draw eye on the enemy
         self.draw_eye_on_sprite()
     
+    @staticmethod
+    def get_body_image(width, height, color):
+        """Return the cached blank body surface for this size and color."""
+        key = (width, height, color)
+        image = Enemy._image_cache.get(key)
+        if image is None:
+            image = pygame.Surface((width, height)).convert()
+            image.fill(color)
+            Enemy._image_cache[key] = image
+        return image
+    
     def draw_eye_on_sprite(self):
-        """Draw a simple white square eye on the enemy sprite"""
-        # Position eye near the head area
-        eye_size = 6  # Small square
-        eye_x = self.width // 2 - eye_size // 2  # Center horizontally
-        eye_y = 8  # Near the top (head area)
-        
-        # Offset eye based on movement direction
-        offset = 6  # Pixels to offset
-        
-        # Horizontal offset based on direction
-        if self.direction > 0:  # Moving right
-            eye_x += offset
-        else:  # Moving left
-            eye_x -= offset
-        
-        # Vertical offset based on velocity
-        if self.velocity_y < 0:  # Moving up (jumping)
-            eye_y -= offset
-        elif self.velocity_y > 0:  # Moving down (falling)
-            eye_y += offset
-        
-        # Draw white square eye directly on the sprite
-        pygame.draw.rect(self.image, (0, 0, 0), (eye_x, eye_y, eye_size, eye_size))
+        """Show the enemy sprite with its eye for the current movement state.
+
+        The eye can only be in one of six places, so each look is rendered
+        once into a shared surface and the enemy just switches to it.
+        """
+        velocity_y = self.velocity_y
+        look = (self.direction > 0, (velocity_y > 0) - (velocity_y < 0))
+        # The eye is placed from self.width, which need not match the image size
+        key = (self.image.get_size(), self.width, self.color, look)
+        sprite = Enemy._sprite_cache.get(key)
+        if sprite is None:
+            width, height = key[0]
+            eye_x, eye_y = self.get_eye_position()
+            sprite = Enemy.get_body_image(width, height, self.color).copy()
+            # Draw white square eye directly on the sprite
+            pygame.draw.rect(sprite, (0, 0, 0), (eye_x, eye_y, 6, 6))
+            Enemy._sprite_cache[key] = sprite
+        self.image = sprite
+    
+    def get_eye_position(self):
+        """Return the top-left of the eye square within the sprite."""
+        # Eye is a 6px square centered near the head area, offset 6px towards
+        # the movement direction (see _EYE_OFFSETS)
+        velocity_y = self.velocity_y
+        offset_x, offset_y = Enemy._EYE_OFFSETS[self.direction > 0, (velocity_y > 0) - (velocity_y < 0)]
+        return self.width // 2 - 3 + offset_x, 8 + offset_y
     
     def get_movement_behavior(self):
         """Get movement behavior for this enemy type. Override in subclasses."""
         return self.direction * self.speed
     
-    def update(self, solid_tiles, one_way_tiles, level_height, level_width):
+    def update(self, solid_grid, one_way_grid, level_height, level_width):
         """Update enemy position and behavior.
 
+        solid_grid/one_way_grid: TileGrid spatial indexes over the level's tiles.
         Solid tiles block movement in all directions.
         One-way platforms only block vertical movement from above.
         """
         if not self.active:
             return
 
-        # Get movement behavior (can be overridden by subclasses)
-        self.velocity_x = self.get_movement_behavior()
+        # Bind the rect once; the physics below is plain local arithmetic
+        rect = self.rect
+
+        # Movement accumulates in float positions so fractional speeds aren't
+        # lost to Rect rounding; pick up any outside move of the rect first
+        pos_x = self.pos_x
+        pos_y = self.pos_y
+        if not -0.5 <= pos_x - rect.x <= 0.5:
+            pos_x = rect.x
+        if not -0.5 <= pos_y - rect.y <= 0.5:
+            pos_y = rect.y
+
+        # Get movement behavior; plain patrollers skip the per-frame hook call
+        if self.has_custom_movement:
+            velocity_x = self.get_movement_behavior()
+        else:
+            velocity_x = self.direction * self.speed
+        self.velocity_x = velocity_x
 
         # Apply gravity
+        velocity_y = self.velocity_y
         if not self.on_ground:
-            self.velocity_y += self.gravity
-            if self.velocity_y > self.max_fall_speed:
-                self.velocity_y = self.max_fall_speed
+            velocity_y += self.gravity
+            max_fall_speed = self.max_fall_speed
+            if velocity_y > max_fall_speed:
+                velocity_y = max_fall_speed
+            self.velocity_y = velocity_y
+
+        # One grid lookup per kind serves both axis checks: the swept rect covers
+        # every position the enemy can occupy this frame (padded for rounding)
+        sweep = rect.union(rect.move(velocity_x, velocity_y)).inflate(2, 2)
+        nearby_solid = solid_grid.query(sweep)
 
         # Move horizontally
-        self.rect.x += self.velocity_x
+        pos_x += velocity_x
+        rect.x = pos_x
 
-        # Check level boundaries and reverse direction if at edge
-        if self.rect.left <= 0:
-            self.rect.left = 0
-            self.direction *= -1
-        elif self.rect.right >= level_width:
-            self.rect.right = level_width
-            self.direction *= -1
+        # Check level boundaries and reverse direction if at (or past) an edge;
+        # one chained comparison covers both edges in the common case
+        x = rect.x
+        max_x = level_width - rect.width
+        if not 0 < x < max_x:
+            rect.x = pos_x = min(max(x, 0), max_x)
+            self.direction = -self.direction
 
         # Check horizontal tile collisions (only solid tiles, not one-way platforms)
-        # Direction changes will happen in check_horizontal_collisions
-        self.check_horizontal_collisions(solid_tiles)
+        # Direction changes will happen in check_horizontal_collisions; with no
+        # solid tile anywhere in the sweep there is nothing to resolve
+        if nearby_solid:
+            moved_x = rect.x
+            self.check_horizontal_collisions(nearby_solid)
+            if rect.x != moved_x:
+                pos_x = rect.x
+        self.pos_x = pos_x
 
         # Move vertically
-        self.rect.y += self.velocity_y
+        pos_y += velocity_y
+        rect.y = pos_y
+        moved_y = rect.y
 
-        # Check vertical collisions
-        self.check_vertical_collisions(solid_tiles, one_way_tiles, level_height)
+        # Check vertical collisions against nearby tiles only; one-way platforms
+        # can only catch a falling enemy, so skip that lookup otherwise
+        nearby_one_way = one_way_grid.query(sweep) if velocity_y > 0 else ()
+        self.check_vertical_collisions(nearby_solid, nearby_one_way, level_height)
+        self.pos_y = rect.y if rect.y != moved_y else pos_y
+    
+    @classmethod
+    def update_all(cls, enemies, solid_grid, one_way_grid, level_height, level_width, player_pos,
+                   active_area=None):
+        """Update every active enemy for one frame.
+
+        Skips dead enemies before the method call and picks the update
+        signature from a class flag instead of isinstance checks per enemy.
+        If active_area (a level-space Rect) is given, enemies outside it skip
+        movement and collision and only tick their timers (see update_offscreen)
+        until they come back into range.
+        """
+        for enemy in enemies:
+            if not enemy.active:
+                continue
+            if active_area is not None and not active_area.colliderect(enemy.rect):
+                enemy.update_offscreen()
+                continue
+            if enemy.uses_player_position:
+                enemy.update(solid_grid, one_way_grid, level_height, level_width, player_pos)
+            else:
+                enemy.update(solid_grid, one_way_grid, level_height, level_width)
+    
+    def update_offscreen(self):
+        """Cheap per-frame update for an enemy frozen outside the active area."""
+        pass
     
     def check_horizontal_collisions(self, tiles):
         """Check for horizontal collisions with solid tiles only (platforms ignore horizontal collision)."""
-        for tile in tiles:
-            if self.rect.colliderect(tile):
-                if self.velocity_x > 0:  # Moving right
-                    self.rect.right = tile.left
-                elif self.velocity_x < 0:  # Moving left
-                    self.rect.left = tile.right
-                self.direction *= -1  # Reverse direction on collision
+        # Rect.collidelistall runs the overlap scan in C; only hits are resolved here
+        hits = 0
+        for index in self.rect.collidelistall(tiles):
+            tile = tiles[index]
+            # An earlier snap may already have pushed the enemy out of this tile
+            if not self.rect.colliderect(tile):
+                continue
+            if self.velocity_x > 0:  # Moving right
+                self.rect.right = tile.left
+            elif self.velocity_x < 0:  # Moving left
+                self.rect.left = tile.right
+            hits += 1
+        
+        # Each collision reverses direction, so only an odd number of hits flips it
+        self.direction *= 1 - 2 * (hits & 1)
     
     def check_vertical_collisions(self, solid_tiles, one_way_tiles, level_height):
         """Check vertical collisions. Solid tiles block all directions, platforms only block from above."""
         self.on_ground = False
 
+        # Only the first overlapping tile matters: resolving it zeroes velocity_y,
+        # so Rect.collidelist (a C-level scan) finds everything we need.
+
         # Check solid tiles (full collision)
-        for tile in solid_tiles:
-            if self.rect.colliderect(tile):
-                if self.velocity_y > 0:  # Falling down
-                    self.rect.bottom = tile.top
-                    self.velocity_y = 0
-                    self.on_ground = True
-                elif self.velocity_y < 0:  # Moving up
-                    self.rect.top = tile.bottom
-                    self.velocity_y = 0
+        index = self.rect.collidelist(solid_tiles)
+        if index != -1:
+            tile = solid_tiles[index]
+            if self.velocity_y > 0:  # Falling down
+                self.rect.bottom = tile.top
+                self.velocity_y = 0
+                self.on_ground = True
+            elif self.velocity_y < 0:  # Moving up
+                self.rect.top = tile.bottom
+                self.velocity_y = 0
 
         # Check one-way platforms (only block when falling onto them from above)
-        for tile in one_way_tiles:
-            if self.rect.colliderect(tile):
-                if self.velocity_y > 0:  # Only when falling
-                    self.rect.bottom = tile.top
-                    self.velocity_y = 0
-                    self.on_ground = True
+        if self.velocity_y > 0:
+            index = self.rect.collidelist(one_way_tiles)
+            if index != -1:
+                self.rect.bottom = one_way_tiles[index].top
+                self.velocity_y = 0
+                self.on_ground = True
 
         # Clamp to level bottom
         if self.rect.bottom >= level_height:
@@ -181,37 +309,77 @@ class Enemy(pygame.sprite.Sprite):
         if not self.active:
             return
         
-        # Recreate visual (including eye) each frame to reflect current state
-        self.image.fill(self.color)
-        self.draw_eye_on_sprite()
-        
         # Draw enemy with camera offset
-        screen_pos = (self.rect.x - camera_x, self.rect.y - camera_y)
-        screen.blit(self.image, screen_pos)
+        screen.blits(self.get_blit_items(camera_x, camera_y), doreturn=0)
         
         # Draw health bar if damaged
         if self.health < self.max_health:
             self.draw_health_bar(screen, camera_x, camera_y)
     
+    def get_blit_items(self, camera_x=0, camera_y=0):
+        """Return the (surface, position) pairs that draw this enemy with camera offset."""
+        # Switch to the cached sprite whose eye reflects the current state
+        self.draw_eye_on_sprite()
+        
+        return [(self.image, (self.rect.x - camera_x, self.rect.y - camera_y))]
+    
+    @classmethod
+    def get_all_blit_items(cls, enemies, camera_x=0, camera_y=0, view_rect=None):
+        """Return the blit sequence for all active enemies and their health bars.
+        
+        If view_rect (a level-space Rect) is given, enemies outside it are left
+        out, except those with projectiles that may still be on screen.
+        """
+        blit_sequence = []
+        damaged = []
+        for enemy in enemies:
+            if not enemy.active:
+                continue
+            if (view_rect is not None and not enemy.has_projectiles and
+                    not view_rect.colliderect(enemy.rect)):
+                continue
+            blit_sequence.extend(enemy.get_blit_items(camera_x, camera_y))
+            if enemy.health < enemy.max_health:
+                damaged.append(enemy)
+        
+        # Health bars go on top of every enemy sprite, in the same blit call
+        for enemy in damaged:
+            blit_sequence.append((enemy.get_health_bar_image(),
+                                  (enemy.rect.x - camera_x, enemy.rect.y - camera_y - 10)))
+        return blit_sequence
+    
     def draw_health_bar(self, screen, camera_x=0, camera_y=0):
         """Draw enemy's health bar with camera offset."""
-        bar_width = self.width
-        bar_height = 6
         bar_x = self.rect.x - camera_x
         bar_y = self.rect.y - camera_y - 10
-        
-        # Background (red)
-        pygame.draw.rect(screen, (255, 0, 0), 
-                        (bar_x, bar_y, bar_width, bar_height))
-        
-        # Health (green)
+        screen.blit(self.get_health_bar_image(), (bar_x, bar_y))
+    
+    def get_health_bar_image(self):
+        """Return the cached health bar surface for the current health."""
+        bar_width = self.width
         health_width = int((self.health / self.max_health) * bar_width)
-        pygame.draw.rect(screen, (0, 255, 0), 
-                        (bar_x, bar_y, health_width, bar_height))
         
-        # Border
-        pygame.draw.rect(screen, (255, 255, 255), 
-                        (bar_x, bar_y, bar_width, bar_height), 1)
+        # Bars only differ by their width and filled width, so enemies whose
+        # health works out to the same fraction share one surface
+        key = (bar_width, health_width)
+        image = Enemy._hp_bar_cache.get(key)
+        if image is None:
+            bar_height = 6
+            image = pygame.Surface((bar_width, bar_height)).convert()
+            
+            # Background (red)
+            image.fill((255, 0, 0))
+            
+            # Health (green)
+            pygame.draw.rect(image, (0, 255, 0), 
+                            (0, 0, health_width, bar_height))
+            
+            # Border
+            pygame.draw.rect(image, (255, 255, 255), 
+                            (0, 0, bar_width, bar_height), 1)
+            
+            Enemy._hp_bar_cache[key] = image
+        return image
     
     def get_rect(self):
         """Return the enemy's rectangle for collision detection."""
@@ -245,6 +413,8 @@ class Enemy(pygame.sprite.Sprite):
 class BasicEnemy(Enemy):
     """Basic enemy with simple left-right movement."""
     
+    __slots__ = ()
+    
     def setup_properties(self):
         """Set up basic enemy properties."""
         self.speed = 1
@@ -257,53 +427,86 @@ class BasicEnemy(Enemy):
 class AmbushEnemy(Enemy):
     """Enemy that hangs from platforms/blocks, dashes to detected player positions, stays there briefly, then returns to hanging position."""
     
-    def __init__(self, x, y, solid_tiles=None, one_way_tiles=None):
+    __slots__ = ('detection_range', 'max_dash_distance', 'detection_range_sq',
+                 'max_dash_distance_sq', 'state', 'attack_cooldown',
+                 'max_attack_cooldown', 'dash_speed', 'return_speed',
+                 'has_gravity', 'hanging_position', 'attack_start_position', 'target_position',
+                 'stay_timer', 'stay_duration', 'original_position',
+                 '_hang_x', '_hang_y')
+    
+    uses_player_position = True
+    
+    # Behavior states; update() dispatches on self.state through _STATE_HANDLERS
+    IDLE, ATTACKING, STAYING, RETURNING = range(4)
+    
+    # 75-degree attack cone means 37.5 degrees on each side of straight down
+    _TAN_HALF_CONE = math.tan(math.radians(37.5))
+    
+    def __init__(self, x, y, tile_grids=None):
+        """Initialize the ambush enemy.
+        
+        tile_grids: (solid_grid, one_way_grid) TileGrid pair to hang from (Level.get_tile_grids)
+        """
         super().__init__(x, y)
         self.detection_range = 500  # How far the enemy can detect the player
         self.max_dash_distance = 500  # Maximum distance the enemy can dash
-        self.is_attacking = False
+        # Squared ranges let the per-frame distance checks skip the square root
+        self.detection_range_sq = self.detection_range ** 2
+        self.max_dash_distance_sq = self.max_dash_distance ** 2
+        self.state = AmbushEnemy.IDLE  # Hanging and waiting for the player
         self.attack_cooldown = 0
         self.max_attack_cooldown = 180  # 3 seconds at 60fps
         self.dash_speed = 5  # Speed when dashing towards player
         self.return_speed = 2  # Speed when returning to original position
-        self.is_returning = False
         self.has_gravity = False  # This enemy ignores gravity
         self.hanging_position = None  # Position where enemy hangs from platform
         self.attack_start_position = None  # Position where dash attack started
         self.target_position = None  # Where the player was detected (dash target)
-        self.is_staying = False  # Whether enemy is staying at target position
         self.stay_timer = 0  # Timer for staying at target position
         self.stay_duration = 120  # How long to stay at target (2 seconds at 60fps)
         
         # Find platform/block to hang from during initialization
-        if solid_tiles is not None or one_way_tiles is not None:
-            self.find_hanging_position(x, y, solid_tiles or [], one_way_tiles or [])
+        if tile_grids is not None:
+            self.find_hanging_position(x, y, tile_grids)
         else:
             # Fallback to original position if no tiles provided
             self.hanging_position = (x, y)
         
+        # Unpacked once for the idle branch of update()
+        self._hang_x, self._hang_y = self.hanging_position
+        
         self.original_position = self.hanging_position  # Remember hanging position
         
-    def find_hanging_position(self, spawn_x, spawn_y, solid_tiles, one_way_tiles):
+    def find_hanging_position(self, spawn_x, spawn_y, tile_grids):
         """Find the nearest platform or block above the spawn point to hang from."""
-        all_tiles = solid_tiles + one_way_tiles
         search_radius = 200  # How far to search for platforms/blocks
         closest_tile = None
-        closest_distance = float('inf')
+        closest_distance_sq = float('inf')
+        
+        # Horizontal search bounds, computed once instead of per tile
+        min_x = spawn_x - search_radius
+        max_x = spawn_x + search_radius
+        
+        # Only tiles in the band around and above the spawn point can qualify
+        solid_grid, one_way_grid = tile_grids
+        search_area = pygame.Rect(min_x, 0, max_x - min_x + 1, max(spawn_y, 1))
+        nearby_tiles = chain(solid_grid.query(search_area), one_way_grid.query(search_area))
         
         # Search for tiles within range and above the spawn point
-        for tile in all_tiles:
-            # Check if tile is within horizontal search range
-            if abs(tile.centerx - spawn_x) <= search_radius:
-                # Check if tile is above the spawn point
-                if tile.bottom <= spawn_y:
-                    # Calculate distance to this tile
-                    distance = ((tile.centerx - spawn_x) ** 2 + (tile.bottom - spawn_y) ** 2) ** 0.5
-                    
-                    # Keep track of closest tile
-                    if distance < closest_distance:
-                        closest_distance = distance
-                        closest_tile = tile
+        for tile in nearby_tiles:
+            centerx = tile.centerx
+            bottom = tile.bottom
+            # Check if tile is within horizontal search range and above the spawn point
+            if min_x <= centerx <= max_x and bottom <= spawn_y:
+                # Squared distance ranks tiles the same as the true distance
+                dx = centerx - spawn_x
+                dy = bottom - spawn_y
+                distance_sq = dx * dx + dy * dy
+                
+                # Keep track of closest tile
+                if distance_sq < closest_distance_sq:
+                    closest_distance_sq = distance_sq
+                    closest_tile = tile
         
         if closest_tile:
             # Position enemy to hang from the bottom of the closest tile
@@ -326,42 +529,37 @@ class AmbushEnemy(Enemy):
         if distance_y <= 0:
             return False
         
-        # Calculate the cone boundaries at the player's distance
-        # The cone expands as it gets further from the enemy
-        player_distance = math.sqrt(distance_x ** 2 + distance_y ** 2)
-        
-        # 75-degree cone means 37.5 degrees on each side of straight down
-        half_cone_angle_radians = math.radians(37.5)
-        
-        # Calculate the maximum horizontal distance allowed at this vertical distance
+        # The cone expands as it gets further from the enemy. Calculate the
+        # maximum horizontal distance allowed at this vertical distance
         # Using trigonometry: tan(angle) = opposite/adjacent = horizontal_distance/vertical_distance
-        max_horizontal_distance = distance_y * math.tan(half_cone_angle_radians)
+        max_horizontal_distance = distance_y * AmbushEnemy._TAN_HALF_CONE
         
         # Check if the player is within the cone boundaries
         return abs(distance_x) <= max_horizontal_distance
     
+    def query_path_tiles(self, player_x, player_y, solid_grid):
+        """Return the solid tiles near the line from the enemy to the player."""
+        # Bounding box of the sight line, padded by the sight line's half-width
+        left = min(self.rect.centerx, player_x) - 5
+        top = min(self.rect.centery, player_y) - 5
+        width = abs(player_x - self.rect.centerx) + 10
+        height = abs(player_y - self.rect.centery) + 10
+        return solid_grid.query(pygame.Rect(left, top, width, height))
+    
     def has_clear_path_to_player(self, player_x, player_y, solid_tiles):
         """Check if there's a clear path to the player through solid blocks (platforms are ignored)."""
-        # Calculate the path from enemy to player
-        start_x, start_y = self.rect.centerx, self.rect.centery
-        end_x, end_y = player_x, player_y
-        
-        # Use line-of-sight checking with multiple sample points along the path
-        num_checks = 10  # Number of points to check along the path
-        
-        for i in range(1, num_checks + 1):
-            # Calculate intermediate point along the line from enemy to player
-            t = i / num_checks  # Parameter from 0 to 1
-            check_x = start_x + t * (end_x - start_x)
-            check_y = start_y + t * (end_y - start_y)
-            
-            # Create a small rect for this check point
-            check_rect = pygame.Rect(check_x - 5, check_y - 5, 10, 10)
-            
-            # Check if this point intersects with any solid tiles (not platforms)
-            for tile in solid_tiles:
-                if check_rect.colliderect(tile):
-                    return False  # Path is blocked by solid tile
+        # Nothing near the sight line can block it
+        if not solid_tiles:
+            return True
+        
+        # The sight line is 10px wide: a solid tile grown by 5px on every side
+        # blocks it exactly when the centre line crosses the grown tile.
+        # Rect.clipline does that segment test in C along the whole path.
+        start = self.rect.center
+        end = (player_x, player_y)
+        for tile in solid_tiles:
+            if tile.inflate(10, 10).clipline(start, end):
+                return False  # Path is blocked by solid tile
         
         return True  # Clear path found
     
@@ -375,180 +573,35 @@ class AmbushEnemy(Enemy):
     
     def get_movement_behavior(self):
         """Ambush movement behavior - no normal movement, only dashing."""
-        # Reduce attack cooldown
-        if self.attack_cooldown > 0:
-            self.attack_cooldown -= 1
+        # The attack cooldown is only counted down in update(), and only while
+        # idle; decrementing it here as well would halve it if this were called
         
         # No normal movement - this enemy stays in place when not attacking
         return 0
     
-    def update(self, solid_tiles, one_way_tiles, level_height, level_width, player_pos=None):
+    def update_offscreen(self):
+        """Keep the attack cooldown running while frozen off screen."""
+        if self.attack_cooldown > 0 and self.state == AmbushEnemy.IDLE:
+            self.attack_cooldown -= 1
+    
+    def update(self, solid_grid, one_way_grid, level_height, level_width, player_pos=None):
         """Update with player detection for ambush dash attacks from below only."""
         if not self.active:
             return
         
-        # Only reduce attack cooldown when enemy is back at original position (idle state)
-        if (self.attack_cooldown > 0 and 
-            not self.is_attacking and not self.is_staying and not self.is_returning):
-            self.attack_cooldown -= 1
+        # Only reduce attack cooldown and look for the player while idle at the
+        # original position; a successful detection starts the dash this frame
+        if self.state == AmbushEnemy.IDLE:
+            if self.attack_cooldown > 0:
+                self.attack_cooldown -= 1
+            if player_pos and self.attack_cooldown == 0:
+                self.try_start_attack(player_pos, solid_grid)
         
-        # Check if player is in range and we can attack
-        if (player_pos and self.attack_cooldown == 0 and 
-            not self.is_attacking and not self.is_staying and not self.is_returning):
-            
-            player_x, player_y = player_pos
-            distance_x = player_x - self.rect.centerx
-            distance_y = player_y - self.rect.centery
-            total_distance = (distance_x ** 2 + distance_y ** 2) ** 0.5
-            
-            # Only attack if player is within range, within expanding attack cone, and has clear path
-            if (total_distance <= self.detection_range and 
-                self.is_within_attack_cone(distance_x, distance_y) and
-                self.has_clear_path_to_player(player_x, player_y, solid_tiles)):
-                
-                self.is_attacking = True
-                
-                # Store starting position for distance limiting
-                self.attack_start_position = (self.rect.centerx, self.rect.centery)
-                
-                # Store the center position of the player (assuming player is 32x48)
-                # This makes the ambush target the player's center instead of top-left corner
-                player_width = 32
-                player_height = 48
-                player_center_x = player_x + player_width // 2
-                player_center_y = player_y + player_height // 2
-                
-                # Limit target position to max_dash_distance from starting position
-                target_distance_x = player_center_x - self.rect.centerx
-                target_distance_y = player_center_y - self.rect.centery
-                target_total_distance = math.sqrt(target_distance_x ** 2 + target_distance_y ** 2)
-                
-                # If target is beyond max dash distance, clamp it
-                if target_total_distance > self.max_dash_distance:
-                    # Scale down to max_dash_distance
-                    scale = self.max_dash_distance / target_total_distance
-                    player_center_x = self.rect.centerx + target_distance_x * scale
-                    player_center_y = self.rect.centery + target_distance_y * scale
-                
-                self.target_position = (player_center_x, player_center_y)
-                
-                # Calculate dash direction towards the player's CENTER position
-                distance_to_center_x = player_center_x - self.rect.centerx
-                distance_to_center_y = player_center_y - self.rect.centery
-                distance_to_center = math.sqrt(distance_to_center_x ** 2 + distance_to_center_y ** 2)
-                
-                if distance_to_center > 0:  # Avoid division by zero
-                    direction_x = distance_to_center_x / distance_to_center
-                    direction_y = distance_to_center_y / distance_to_center
-                    
-                    self.velocity_x = direction_x * self.dash_speed
-                    self.velocity_y = direction_y * self.dash_speed
-                
-                self.attack_cooldown = self.max_attack_cooldown
-        
-        # If attacking, dash towards the target position
-        if self.is_attacking and self.target_position and self.attack_start_position:
-            target_x, target_y = self.target_position
-            start_x, start_y = self.attack_start_position
-            
-            # Calculate distance from starting position (for range limit)
-            distance_from_start_x = self.rect.centerx - start_x
-            distance_from_start_y = self.rect.centery - start_y
-            distance_from_start = math.sqrt(distance_from_start_x ** 2 + distance_from_start_y ** 2)
-            
-            # Calculate distance to target
-            distance_to_target_x = target_x - self.rect.centerx
-            distance_to_target_y = target_y - self.rect.centery
-            distance_to_target = math.sqrt(distance_to_target_x ** 2 + distance_to_target_y ** 2)
-            
-            # Stop if we've reached the target OR exceeded max dash distance
-            if distance_to_target <= 20 or distance_from_start >= self.max_dash_distance:
-                self.is_attacking = False
-                self.is_staying = True
-                self.stay_timer = self.stay_duration
-                self.velocity_x = 0
-                self.velocity_y = 0
-                self.attack_start_position = None
-            else:
-                # Check if next movement would overshoot the target
-                next_x = self.rect.x + self.velocity_x
-                next_y = self.rect.y + self.velocity_y
-                next_center_x = next_x + self.width // 2
-                next_center_y = next_y + self.height // 2
-                
-                next_distance_to_target_x = target_x - next_center_x
-                next_distance_to_target_y = target_y - next_center_y
-                next_distance_to_target = math.sqrt(next_distance_to_target_x ** 2 + next_distance_to_target_y ** 2)
-                
-                # If we would overshoot, just snap to target
-                if next_distance_to_target > distance_to_target:
-                    # We're about to overshoot, snap to target instead
-                    self.rect.centerx = target_x
-                    self.rect.centery = target_y
-                    self.is_attacking = False
-                    self.is_staying = True
-                    self.stay_timer = self.stay_duration
-                    self.velocity_x = 0
-                    self.velocity_y = 0
-                    self.attack_start_position = None
-                else:
-                    # Continue moving towards target
-                    self.rect.x += self.velocity_x
-                    self.rect.y += self.velocity_y
-        
-        # If staying at target position for a few seconds
-        elif self.is_staying:
-            # Count down the stay timer
-            self.stay_timer -= 1
-            
-            # Stay motionless at current position
-            self.velocity_x = 0
-            self.velocity_y = 0
-            
-            # When timer expires, start returning
-            if self.stay_timer <= 0:
-                self.is_staying = False
-                self.is_returning = True
-                self.target_position = None  # Clear target
-        
-        # If returning to original hanging position
-        elif self.is_returning:
-            hang_x, hang_y = self.hanging_position
-            
-            # Calculate direction back to hanging position
-            distance_x = hang_x - self.rect.x
-            distance_y = hang_y - self.rect.y
-            total_distance = (distance_x ** 2 + distance_y ** 2) ** 0.5
-            
-            if total_distance > 5:  # If not close enough to hanging position
-                direction_x = distance_x / total_distance
-                direction_y = distance_y / total_distance
-                
-                self.velocity_x = direction_x * self.return_speed
-                self.velocity_y = direction_y * self.return_speed
-                
-                self.rect.x += self.velocity_x
-                self.rect.y += self.velocity_y
-            else:
-                # Close enough to hanging position, snap back and stop
-                self.rect.x = hang_x
-                self.rect.y = hang_y
-                self.velocity_x = 0
-                self.velocity_y = 0
-                self.is_returning = False
-        
-        # When idle, stay at hanging position (no gravity)
-        else:
-            self.velocity_x = 0
-            self.velocity_y = 0
-            # Ensure enemy stays at hanging position when idle
-            if self.hanging_position:
-                hang_x, hang_y = self.hanging_position
-                self.rect.x = hang_x
-                self.rect.y = hang_y
+        # Run the handler for the current state
+        AmbushEnemy._STATE_HANDLERS[self.state](self)
         
         # Check collisions with tiles only when not in attack/return mode
-        if not self.is_attacking and not self.is_returning:
+        if self.state == AmbushEnemy.IDLE or self.state == AmbushEnemy.STAYING:
             # Check level boundaries
             if self.rect.left <= 0:
                 self.rect.left = 0
@@ -559,15 +612,175 @@ class AmbushEnemy(Enemy):
                 self.rect.top = 0
             elif self.rect.bottom >= level_height:
                 self.rect.bottom = level_height
+    
+    def try_start_attack(self, player_pos, solid_grid):
+        """Start a dash towards the player if they are in range, in the cone and in sight."""
+        player_x, player_y = player_pos
+        distance_x = player_x - self.rect.centerx
+        distance_y = player_y - self.rect.centery
+        distance_sq = distance_x * distance_x + distance_y * distance_y
+        
+        # Only attack if player is within range, within expanding attack cone, and has clear path
+        if not (distance_sq <= self.detection_range_sq and 
+                self.is_within_attack_cone(distance_x, distance_y) and
+                self.has_clear_path_to_player(player_x, player_y, self.query_path_tiles(player_x, player_y, solid_grid))):
+            return
+        
+        self.state = AmbushEnemy.ATTACKING
+        
+        # Store starting position for distance limiting
+        self.attack_start_position = (self.rect.centerx, self.rect.centery)
+        
+        # Store the center position of the player (assuming player is 32x48)
+        # This makes the ambush target the player's center instead of top-left corner
+        player_width = 32
+        player_height = 48
+        player_center_x = player_x + player_width // 2
+        player_center_y = player_y + player_height // 2
+        
+        # Limit target position to max_dash_distance from starting position by
+        # scaling the offset along its ray (scale is 1 when already in range)
+        center_x = self.rect.centerx
+        center_y = self.rect.centery
+        target_distance_x = player_center_x - center_x
+        target_distance_y = player_center_y - center_y
+        target_distance = hypot(target_distance_x, target_distance_y)
+        scale = min(1.0, self.max_dash_distance / target_distance) if target_distance > 0 else 0.0
+        self.target_position = (center_x + target_distance_x * scale,
+                                center_y + target_distance_y * scale)
+        
+        # Dash towards the player's CENTER position. Clamping keeps the
+        # target on the same ray, so the one magnitude above normalizes it
+        if target_distance > 0:  # Avoid division by zero
+            speed = self.dash_speed / target_distance
+            self.velocity_x = target_distance_x * speed
+            self.velocity_y = target_distance_y * speed
+        
+        self.attack_cooldown = self.max_attack_cooldown
+    
+    def start_staying(self):
+        """End the dash and wait at the current position."""
+        self.state = AmbushEnemy.STAYING
+        self.stay_timer = self.stay_duration
+        self.velocity_x = 0
+        self.velocity_y = 0
+        self.attack_start_position = None
+    
+    def tick_idle(self):
+        """When idle, stay at hanging position (no gravity)."""
+        self.velocity_x = 0
+        self.velocity_y = 0
+        # Ensure enemy stays at hanging position when idle (usually already there)
+        rect = self.rect
+        if rect.x != self._hang_x:
+            rect.x = self._hang_x
+        if rect.y != self._hang_y:
+            rect.y = self._hang_y
+    
+    def tick_attack(self):
+        """Dash towards the target position."""
+        target_x, target_y = self.target_position
+        start_x, start_y = self.attack_start_position
+        
+        # Calculate distance from starting position (for range limit)
+        distance_from_start_x = self.rect.centerx - start_x
+        distance_from_start_y = self.rect.centery - start_y
+        distance_from_start_sq = (distance_from_start_x * distance_from_start_x +
+                                  distance_from_start_y * distance_from_start_y)
+        
+        # Calculate distance to target
+        distance_to_target_x = target_x - self.rect.centerx
+        distance_to_target_y = target_y - self.rect.centery
+        distance_to_target_sq = (distance_to_target_x * distance_to_target_x +
+                                 distance_to_target_y * distance_to_target_y)
+        
+        # Stop if we've reached the target (within 20px) OR exceeded max dash distance
+        if distance_to_target_sq <= 400 or distance_from_start_sq >= self.max_dash_distance_sq:
+            self.start_staying()
+            return
+        
+        # Check if next movement would overshoot the target
+        next_x = self.rect.x + self.velocity_x
+        next_y = self.rect.y + self.velocity_y
+        next_center_x = next_x + self.width // 2
+        next_center_y = next_y + self.height // 2
+        
+        next_distance_to_target_x = target_x - next_center_x
+        next_distance_to_target_y = target_y - next_center_y
+        next_distance_to_target_sq = (next_distance_to_target_x * next_distance_to_target_x +
+                                      next_distance_to_target_y * next_distance_to_target_y)
+        
+        # If we would overshoot, just snap to target
+        if next_distance_to_target_sq > distance_to_target_sq:
+            # We're about to overshoot, snap to target instead
+            self.rect.centerx = target_x
+            self.rect.centery = target_y
+            self.start_staying()
+        else:
+            # Continue moving towards target
+            self.rect.x += self.velocity_x
+            self.rect.y += self.velocity_y
+    
+    def tick_stay(self):
+        """Stay motionless at the target position for a few seconds."""
+        # Count down the stay timer
+        self.stay_timer -= 1
+        
+        # Stay motionless at current position
+        self.velocity_x = 0
+        self.velocity_y = 0
+        
+        # When timer expires, start returning
+        if self.stay_timer <= 0:
+            self.state = AmbushEnemy.RETURNING
+            self.target_position = None  # Clear target
+    
+    def tick_return(self):
+        """Move back to the original hanging position."""
+        hang_x, hang_y = self.hanging_position
+        
+        # Calculate direction back to hanging position
+        distance_x = hang_x - self.rect.x
+        distance_y = hang_y - self.rect.y
+        distance_sq = distance_x * distance_x + distance_y * distance_y
+        
+        if distance_sq > 25:  # If not within 5px of the hanging position
+            total_distance = sqrt(distance_sq)
+            direction_x = distance_x / total_distance
+            direction_y = distance_y / total_distance
+            
+            self.velocity_x = direction_x * self.return_speed
+            self.velocity_y = direction_y * self.return_speed
+            
+            self.rect.x += self.velocity_x
+            self.rect.y += self.velocity_y
+        else:
+            # Close enough to hanging position, snap back and stop
+            self.rect.x = hang_x
+            self.rect.y = hang_y
+            self.velocity_x = 0
+            self.velocity_y = 0
+            self.state = AmbushEnemy.IDLE
+    
+    # Indexed by state (IDLE, ATTACKING, STAYING, RETURNING)
+    _STATE_HANDLERS = (tick_idle, tick_attack, tick_stay, tick_return)
 
 
 class JumpingEnemy(Enemy):
     """Enemy that occasionally jumps while moving back and forth."""
     
+    __slots__ = ('jump_timer', 'jump_interval', 'jump_force')
+    
+    # Jump intervals are rolled in bulk once and cycled through, keeping
+    # the random module out of the per-frame movement path
+    JUMP_INTERVAL_BUFFER_SIZE = 4096  # Must be a power of two
+    _jump_intervals = None
+    _jump_interval_index = 0
+    
     def __init__(self, x, y):
         super().__init__(x, y)
         self.jump_timer = 0
-        self.jump_interval = random.randint(90, 150)  # 1.5-2.5 seconds at 60fps
+        self.jump_interval = JumpingEnemy.next_jump_interval()  # 1.5-2.5 seconds at 60fps
         self.jump_force = -10  # Moderate jump height
     
     def setup_properties(self):
@@ -587,26 +800,43 @@ class JumpingEnemy(Enemy):
             self.velocity_y = self.jump_force
             self.jump_timer = 0
             # Randomize next jump interval
-            self.jump_interval = random.randint(90, 150)
+            self.jump_interval = JumpingEnemy.next_jump_interval()
         
         return self.direction * self.speed
+    
+    @staticmethod
+    def next_jump_interval():
+        """Return the next pre-rolled jump interval (90-150 frames)."""
+        intervals = JumpingEnemy._jump_intervals
+        if intervals is None:
+            intervals = JumpingEnemy._jump_intervals = _RNG.choices(
+                range(90, 151), k=JumpingEnemy.JUMP_INTERVAL_BUFFER_SIZE)
+        index = JumpingEnemy._jump_interval_index
+        JumpingEnemy._jump_interval_index = (index + 1) & (JumpingEnemy.JUMP_INTERVAL_BUFFER_SIZE - 1)
+        return intervals[index]
 
 
-class BossBullet(pygame.sprite.Sprite):
+class BossBullet:
     """Boss bullet projectile."""
     
+    # Plain class with slots (like the player's Bullet): boss bullets live in a
+    # plain list and are created in bursts, so no sprite group bookkeeping
+    __slots__ = ('width', 'height', 'image', 'rect', 'velocity_x', 'velocity_y',
+                 'damage', 'active')
+    
+    # Shared image for every boss bullet, built once on first use (see load_image)
+    _IMAGE = None
+    
     def __init__(self, x, y, velocity_x, velocity_y):
         """Initialize a boss bullet with specific velocity."""
-        super().__init__()
-        
         # Bullet dimensions
         self.width = 12
         self.height = 12
         
-        # Create circular bullet
-        self.image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, (255, 50, 50), (self.width // 2, self.height // 2), self.width // 2)
-        pygame.draw.circle(self.image, (200, 0, 0), (self.width // 2, self.height // 2), self.width // 2, 2)
+        # All boss bullets look identical, so they share one surface
+        if BossBullet._IMAGE is None:
+            BossBullet.load_image(self.width, self.height)
+        self.image = BossBullet._IMAGE
         
         # Position and movement
         self.rect = self.image.get_rect()
@@ -629,6 +859,40 @@ class BossBullet(pygame.sprite.Sprite):
             self.rect.bottom < -100 or self.rect.top > level_height + 100):
             self.active = False
     
+    @classmethod
+    def load_image(cls, width=12, height=12):
+        """Build the shared circular bullet image (needs the display to be set up)."""
+        # Create circular bullet
+        image = pygame.Surface((width, height), pygame.SRCALPHA)
+        pygame.draw.circle(image, (255, 50, 50), (width // 2, height // 2), width // 2)
+        pygame.draw.circle(image, (200, 0, 0), (width // 2, height // 2), width // 2, 2)
+        cls._IMAGE = image.convert_alpha()
+    
+    @classmethod
+    def update_all(cls, bullets, level_width, level_height):
+        """Advance every bullet by one frame and return those still active.
+
+        Does the work of update() for the whole list in one loop, with the
+        out-of-bounds limits computed once instead of per bullet.
+        """
+        min_x = min_y = -100
+        max_x = level_width + 100
+        max_y = level_height + 100
+        alive = []
+        append = alive.append
+        for bullet in bullets:
+            rect = bullet.rect
+            rect.x += bullet.velocity_x
+            rect.y += bullet.velocity_y
+            
+            # Deactivate if out of bounds
+            if (rect.right < min_x or rect.left > max_x or
+                    rect.bottom < min_y or rect.top > max_y):
+                bullet.active = False
+            elif bullet.active:
+                append(bullet)
+        return alive
+    
     def draw(self, screen, camera_x=0, camera_y=0):
         """Draw the bullet to the screen with camera offset."""
         if not self.active:
@@ -649,6 +913,34 @@ class BossBullet(pygame.sprite.Sprite):
 class BossEnemy(Enemy):
     """Boss enemy with three special attacks: jump-shoot, jump-slam, and ultimate circular barrage."""
     
+    __slots__ = ('current_attack', 'next_attack_time', 'min_attack_cooldown', 'attack_counter',
+                 'jump_shoot_state', 'jump_shoot_bullets_fired', 'jump_shoot_next_fire_time',
+                 'jump_shoot_target_x', 'jump_shoot_target_y', 'jump_slam_state', 'slam_bullets_created',
+                 'slam_recovery_end_time', 'ultimate_state', 'ultimate_end_time',
+                 'ultimate_next_shot_time', 'ultimate_angle', 'ultimate_position', 'bullets',
+                 'jump_force')
+    
+    uses_player_position = True
+    has_projectiles = True
+    
+    # Attack timings in milliseconds, checked against pygame.time.get_ticks()
+    # deadlines so they don't depend on the frame rate
+    JUMP_SHOOT_FIRE_INTERVAL = 250  # Fire every 0.25 seconds
+    SLAM_RECOVERY_TIME = 500  # 0.5 second recovery
+    ULTIMATE_DURATION = 3000  # Shoot for 3 seconds
+    ULTIMATE_FIRE_INTERVAL = 83  # Fire very rapidly (every 5 frames at 60 FPS)
+    
+    # Spread shot velocities (speed 6): down-left, down, down-right. Angles are
+    # degrees from straight down; +90 because 0 degrees is right
+    _SPREAD_VELOCITIES = tuple((6 * math.cos(math.radians(angle_deg + 90)),
+                                6 * math.sin(math.radians(angle_deg + 90)))
+                               for angle_deg in (-45, 0, 45))
+    
+    # Ultimate barrage velocities (speed 5) for each 30-degree step of ultimate_angle
+    _ULTIMATE_VELOCITIES = tuple((5 * math.cos(math.radians(angle_deg)),
+                                  5 * math.sin(math.radians(angle_deg)))
+                                 for angle_deg in range(0, 360, 30))
+    
     def __init__(self, x, y):
         super().__init__(x, y)
         
@@ -658,29 +950,29 @@ class BossEnemy(Enemy):
         
         # Attack state
         self.current_attack = None
-        self.attack_cooldown = 0
-        self.min_attack_cooldown = 120  # 2 seconds between attacks
+        self.next_attack_time = 0  # get_ticks() time when the next attack may start
+        self.min_attack_cooldown = 2000  # 2 seconds between attacks (ms)
         self.attack_counter = 0  # Track number of attacks for ultimate timing
         
         # Jump-shoot attack
         self.jump_shoot_state = None  # 'jumping', 'shooting', 'landing'
         self.jump_shoot_bullets_fired = 0
-        self.jump_shoot_fire_timer = 0
+        self.jump_shoot_next_fire_time = 0
         
         # Jump-slam attack
         self.jump_slam_state = None  # 'jumping', 'slamming', 'recovering'
         self.slam_bullets_created = False
-        self.slam_recovery_timer = 0
+        self.slam_recovery_end_time = None  # Set when the slam lands
         
         # Ultimate attack
         self.ultimate_state = None  # 'rising', 'shooting', 'descending'
-        self.ultimate_timer = 0
-        self.ultimate_shoot_timer = 0
+        self.ultimate_end_time = 0
+        self.ultimate_next_shot_time = 0
         self.ultimate_angle = 0
         self.ultimate_position = None  # Where boss rises to
         
-        # Boss bullets sprite group
-        self.bullets = pygame.sprite.Group()
+        # Boss bullets (plain list, compacted once per frame in update)
+        self.bullets = []
         
     def setup_properties(self):
         """Set up boss properties."""
@@ -700,144 +992,143 @@ class BossEnemy(Enemy):
             return 'ultimate'
         else:
             # Randomly choose between jump-shoot and jump-slam
-            return random.choice(['jump_shoot', 'jump_slam'])
+            return _RNG.choice(['jump_shoot', 'jump_slam'])
     
-    def update(self, solid_tiles, one_way_tiles, level_height, level_width, player_pos=None):
+    def update(self, solid_grid, one_way_grid, level_height, level_width, player_pos=None):
         """Update boss with attack patterns."""
         if not self.active:
             return
         
-        # Update cooldown
-        if self.attack_cooldown > 0:
-            self.attack_cooldown -= 1
+        # Sample the clock once; every attack timer compares against it
+        now = pygame.time.get_ticks()
         
-        # Update bullets
-        for bullet in self.bullets:
-            bullet.update(level_width, level_height)
-            if not bullet.active:
-                self.bullets.remove(bullet)
+        # Update bullets and keep only the active ones in a single pass
+        self.bullets = BossBullet.update_all(self.bullets, level_width, level_height)
         
         # If no current attack and cooldown is done, choose new attack
-        if self.current_attack is None and self.attack_cooldown == 0:
+        if self.current_attack is None and now >= self.next_attack_time:
             self.current_attack = self.choose_attack()
             
             if self.current_attack == 'jump_shoot':
                 self.jump_shoot_state = 'rising'
                 self.jump_shoot_bullets_fired = 0
-                self.jump_shoot_fire_timer = 0
                 # Store target position (above player)
                 if player_pos:
-                    target_x = player_pos[0] - self.width // 2  # Center above player
-                    target_y = player_pos[1] - 150  # 150 pixels above player
+                    self.jump_shoot_target_x = player_pos[0] - self.width // 2  # Center above player
+                    self.jump_shoot_target_y = player_pos[1] - 150  # 150 pixels above player
                 else:
-                    target_x = self.rect.x
-                    target_y = self.rect.y - 150
-                self.jump_shoot_target = (target_x, target_y)
+                    self.jump_shoot_target_x = self.rect.x
+                    self.jump_shoot_target_y = self.rect.y - 150
                 
             elif self.current_attack == 'jump_slam':
                 self.jump_slam_state = 'jumping'
                 self.velocity_y = self.jump_force * 0.8  # Slightly lower jump
                 self.slam_bullets_created = False
-                self.slam_recovery_timer = 0
+                self.slam_recovery_end_time = None
                 
             elif self.current_attack == 'ultimate':
                 self.ultimate_state = 'rising'
-                self.ultimate_timer = 0
-                self.ultimate_shoot_timer = 0
                 self.ultimate_angle = 0
                 # Store target position (high in the air)
                 self.ultimate_position = (self.rect.x, self.rect.y - 200)
         
         # Execute current attack
         if self.current_attack == 'jump_shoot':
-            self.execute_jump_shoot(solid_tiles, one_way_tiles, level_height, level_width, player_pos)
+            self.execute_jump_shoot(solid_grid, one_way_grid, level_height, level_width, player_pos, now)
         elif self.current_attack == 'jump_slam':
-            self.execute_jump_slam(solid_tiles, one_way_tiles, level_height, level_width)
+            self.execute_jump_slam(solid_grid, one_way_grid, level_height, level_width, now)
         elif self.current_attack == 'ultimate':
-            self.execute_ultimate(solid_tiles, one_way_tiles, level_height, level_width)
+            self.execute_ultimate(solid_grid, one_way_grid, level_height, level_width, now)
         else:
             # Normal movement when not attacking
-            self.normal_movement(solid_tiles, one_way_tiles, level_height, level_width)
+            self.normal_movement(solid_grid, one_way_grid, level_height, level_width)
     
-    def normal_movement(self, solid_tiles, one_way_tiles, level_height, level_width):
+    def normal_movement(self, solid_grid, one_way_grid, level_height, level_width):
         """Normal back-and-forth movement."""
         self.velocity_x = self.direction * self.speed
         
         # Apply gravity
         if not self.on_ground:
-            self.velocity_y += self.gravity
-            if self.velocity_y > self.max_fall_speed:
-                self.velocity_y = self.max_fall_speed
+            self.velocity_y = min(self.velocity_y + self.gravity, self.max_fall_speed)
+        
+        # One grid lookup per kind serves both axis checks (see Enemy.update)
+        rect = self.rect
+        sweep = rect.union(rect.move(self.velocity_x, self.velocity_y)).inflate(2, 2)
+        nearby_solid = solid_grid.query(sweep)
         
         # Move horizontally
-        self.rect.x += self.velocity_x
+        rect.x += self.velocity_x
         
         # Check boundaries and reverse
-        if self.rect.left <= 0:
-            self.rect.left = 0
+        if rect.left <= 0:
+            rect.left = 0
             self.direction *= -1
-        elif self.rect.right >= level_width:
-            self.rect.right = level_width
+        elif rect.right >= level_width:
+            rect.right = level_width
             self.direction *= -1
         
-        self.check_horizontal_collisions(solid_tiles)
+        self.check_horizontal_collisions(nearby_solid)
         
         # Move vertically
-        self.rect.y += self.velocity_y
-        self.check_vertical_collisions(solid_tiles, one_way_tiles, level_height)
+        rect.y += self.velocity_y
+        self.check_vertical_collisions(nearby_solid, one_way_grid.query(sweep), level_height)
     
-    def execute_jump_shoot(self, solid_tiles, one_way_tiles, level_height, level_width, player_pos=None):
+    def execute_jump_shoot(self, solid_grid, one_way_grid, level_height, level_width, player_pos=None, now=0):
         """Execute jump and shoot attack: rise above player, hover and shoot, then fall."""
         # Stop velocities during controlled movement
         self.velocity_x = 0
         self.velocity_y = 0
         
         if self.jump_shoot_state == 'rising':
-            # Continuously update target X position to follow player
+            # Continuously update target position to follow player
             if player_pos:
                 target_x = player_pos[0] - self.width // 2  # Center above player
                 target_y = player_pos[1] - 150  # 150 pixels above player
-                self.jump_shoot_target = (target_x, target_y)
+                self.jump_shoot_target_x = target_x
+                self.jump_shoot_target_y = target_y
+            else:
+                target_x = self.jump_shoot_target_x
+                target_y = self.jump_shoot_target_y
+            rect = self.rect
             
-            target_x, target_y = self.jump_shoot_target
-            
-            # Move horizontally toward player's current X position
-            if abs(self.rect.x - target_x) > 5:
-                if self.rect.x < target_x:
-                    self.rect.x += 5
-                else:
-                    self.rect.x -= 5
+            # Move horizontally toward player's current X position; the
+            # comparisons give the step's sign, or 0 within 5px of the target
+            offset_x = rect.x - target_x
+            step_x = ((offset_x < -5) - (offset_x > 5)) * 5
             
             # Move vertically toward target
-            if self.rect.y > target_y:
-                self.rect.y -= 5
+            if rect.y > target_y:
+                step_y = -5
             else:
                 # Reached hover position, start shooting
+                step_y = 0
                 self.jump_shoot_state = 'hovering'
+                self.jump_shoot_next_fire_time = now + self.JUMP_SHOOT_FIRE_INTERVAL
+            
+            # Apply both steps in one call
+            rect.move_ip(step_x, step_y)
         
         elif self.jump_shoot_state == 'hovering':
             # Continuously follow player's X position while hovering
+            rect = self.rect
+            x = rect.x
             if player_pos:
                 target_x = player_pos[0] - self.width // 2  # Center above player
-                # Smoothly move toward player's X position
-                if abs(self.rect.x - target_x) > 3:
-                    if self.rect.x < target_x:
-                        self.rect.x += 3
-                    else:
-                        self.rect.x -= 3
+                # Smoothly move toward player's X position, snapping when close
+                offset_x = x - target_x
+                if -3 <= offset_x <= 3:
+                    x = target_x
                 else:
-                    self.rect.x = target_x
+                    x -= ((offset_x > 0) - (offset_x < 0)) * 3
             
-            # Maintain hover height
-            _, target_y = self.jump_shoot_target
-            self.rect.y = target_y
+            # Maintain hover height; both coordinates are written at once
+            rect.topleft = (x, self.jump_shoot_target_y)
             
             # Fire bullets
-            self.jump_shoot_fire_timer += 1
-            if self.jump_shoot_fire_timer >= 15 and self.jump_shoot_bullets_fired < 3:  # Fire every 0.25 seconds
+            if now >= self.jump_shoot_next_fire_time and self.jump_shoot_bullets_fired < 3:
                 self.fire_bullet_spread()
                 self.jump_shoot_bullets_fired += 1
-                self.jump_shoot_fire_timer = 0
+                self.jump_shoot_next_fire_time = now + self.JUMP_SHOOT_FIRE_INTERVAL
             
             # After firing all bullets, start falling
             if self.jump_shoot_bullets_fired >= 3:
@@ -845,18 +1136,16 @@ class BossEnemy(Enemy):
         
         elif self.jump_shoot_state == 'falling':
             # Apply gravity and fall back down
-            self.velocity_y += self.gravity
-            if self.velocity_y > self.max_fall_speed:
-                self.velocity_y = self.max_fall_speed
+            self.velocity_y = min(self.velocity_y + self.gravity, self.max_fall_speed)
             
             self.rect.y += self.velocity_y
-            self.check_vertical_collisions(solid_tiles, one_way_tiles, level_height)
+            self.check_vertical_collisions(solid_grid.query(self.rect), one_way_grid.query(self.rect), level_height)
             
             # When landing, end attack
             if self.on_ground:
                 self.current_attack = None
                 self.jump_shoot_state = None
-                self.attack_cooldown = self.min_attack_cooldown
+                self.next_attack_time = now + self.min_attack_cooldown
                 self.velocity_x = 0
                 self.velocity_y = 0
     
@@ -865,31 +1154,21 @@ class BossEnemy(Enemy):
         center_x = self.rect.centerx
         center_y = self.rect.centery
         
-        # Three directions: down-left, down, down-right
-        angles = [-45, 0, 45]  # Degrees from straight down
-        bullet_speed = 6
-        
-        for angle_deg in angles:
-            angle_rad = math.radians(angle_deg + 90)  # +90 because 0 degrees is right, we want down
-            vel_x = bullet_speed * math.cos(angle_rad)
-            vel_y = bullet_speed * math.sin(angle_rad)
-            
-            bullet = BossBullet(center_x, center_y, vel_x, vel_y)
-            self.bullets.add(bullet)
+        # Three directions: down-left, down, down-right (precomputed velocities)
+        self.bullets.extend([BossBullet(center_x, center_y, vel_x, vel_y)
+                             for vel_x, vel_y in BossEnemy._SPREAD_VELOCITIES])
     
-    def execute_jump_slam(self, solid_tiles, one_way_tiles, level_height, level_width):
+    def execute_jump_slam(self, solid_grid, one_way_grid, level_height, level_width, now=0):
         """Execute jump and slam with horizontal projectiles shot while in air."""
         # Stop horizontal movement during attack
         self.velocity_x = 0
         
         if self.jump_slam_state == 'jumping':
-            # Apply gravity
-            self.velocity_y += self.gravity * 1.5  # Fall faster for slam
-            if self.velocity_y > self.max_fall_speed * 1.5:
-                self.velocity_y = self.max_fall_speed * 1.5
+            # Apply gravity, falling faster for slam
+            self.velocity_y = min(self.velocity_y + self.gravity * 1.5, self.max_fall_speed * 1.5)
             
             self.rect.y += self.velocity_y
-            self.check_vertical_collisions(solid_tiles, one_way_tiles, level_height)
+            self.check_vertical_collisions(solid_grid.query(self.rect), one_way_grid.query(self.rect), level_height)
             
             # Shoot bullets while falling (in the air)
             if self.velocity_y > 0 and not self.slam_bullets_created:  # Falling downward
@@ -905,37 +1184,31 @@ class BossEnemy(Enemy):
             self.velocity_x = 0
             self.velocity_y = 0
             
-            # Initialize recovery timer when entering this state
-            if self.slam_recovery_timer == 0:
-                self.slam_recovery_timer = 30  # 0.5 second recovery
-            
-            # Count down recovery
-            self.slam_recovery_timer -= 1
+            # Start the recovery timer when entering this state
+            if self.slam_recovery_end_time is None:
+                self.slam_recovery_end_time = now + self.SLAM_RECOVERY_TIME
             
             # End attack when recovery is complete
-            if self.slam_recovery_timer <= 0:
+            if now >= self.slam_recovery_end_time:
                 self.current_attack = None
                 self.jump_slam_state = None
-                self.slam_recovery_timer = 0  # Reset for next attack
-                self.attack_cooldown = self.min_attack_cooldown
+                self.slam_recovery_end_time = None  # Reset for next attack
+                self.next_attack_time = now + self.min_attack_cooldown
                 self.velocity_x = 0
                 self.velocity_y = 0
     
     def create_slam_projectiles(self):
         """Create horizontal projectiles on both sides after slam."""
         center_y = self.rect.centery
+        left = self.rect.left
+        right = self.rect.right
         
-        # Create 3 bullets going left
-        for i in range(3):
-            bullet = BossBullet(self.rect.left, center_y + i * 8 - 8, -8, 0)
-            self.bullets.add(bullet)
-        
-        # Create 3 bullets going right
-        for i in range(3):
-            bullet = BossBullet(self.rect.right, center_y + i * 8 - 8, 8, 0)
-            self.bullets.add(bullet)
+        # Create 3 bullets going left, then 3 going right, in one extend
+        self.bullets.extend(
+            [BossBullet(left, center_y + i * 8 - 8, -8, 0) for i in range(3)] +
+            [BossBullet(right, center_y + i * 8 - 8, 8, 0) for i in range(3)])
     
-    def execute_ultimate(self, solid_tiles, one_way_tiles, level_height, level_width):
+    def execute_ultimate(self, solid_grid, one_way_grid, level_height, level_width, now=0):
         """Execute ultimate attack: rise up and shoot bullets in circular pattern rapidly."""
         if self.ultimate_state == 'rising':
             # Stop all movement
@@ -950,21 +1223,20 @@ class BossEnemy(Enemy):
                 self.rect.y -= 5
             else:
                 self.ultimate_state = 'shooting'
-                self.ultimate_timer = 180  # Shoot for 3 seconds
+                self.ultimate_end_time = now + self.ULTIMATE_DURATION
+                self.ultimate_next_shot_time = now + self.ULTIMATE_FIRE_INTERVAL
         
         elif self.ultimate_state == 'shooting':
             # Stay in place and shoot bullets in circle
             self.velocity_x = 0
             self.velocity_y = 0
             
-            self.ultimate_shoot_timer += 1
-            if self.ultimate_shoot_timer >= 5:  # Fire very rapidly
+            if now >= self.ultimate_next_shot_time:
                 self.fire_circular_bullet()
-                self.ultimate_shoot_timer = 0
+                self.ultimate_next_shot_time = now + self.ULTIMATE_FIRE_INTERVAL
                 self.ultimate_angle += 30  # Rotate pattern
             
-            self.ultimate_timer -= 1
-            if self.ultimate_timer <= 0:
+            if now >= self.ultimate_end_time:
                 self.ultimate_state = 'descending'
         
         elif self.ultimate_state == 'descending':
@@ -972,14 +1244,12 @@ class BossEnemy(Enemy):
             self.velocity_x = 0
             
             # Fall back down
-            self.velocity_y += self.gravity
-            if self.velocity_y > self.max_fall_speed:
-                self.velocity_y = self.max_fall_speed
+            self.velocity_y = min(self.velocity_y + self.gravity, self.max_fall_speed)
             
             self.rect.y += self.velocity_y
             
             # Check collisions to detect landing
-            self.check_vertical_collisions(solid_tiles, one_way_tiles, level_height)
+            self.check_vertical_collisions(solid_grid.query(self.rect), one_way_grid.query(self.rect), level_height)
             
             # When landed on ground, end attack
             if self.on_ground:
@@ -987,31 +1257,27 @@ class BossEnemy(Enemy):
                 self.velocity_x = 0
                 self.current_attack = None
                 self.ultimate_state = None
-                self.attack_cooldown = self.min_attack_cooldown * 2  # Longer cooldown after ultimate
+                self.next_attack_time = now + self.min_attack_cooldown * 2  # Longer cooldown after ultimate
     
     def fire_circular_bullet(self):
         """Fire a bullet in the current angle direction."""
         center_x = self.rect.centerx
         center_y = self.rect.centery
         
-        bullet_speed = 5
-        angle_rad = math.radians(self.ultimate_angle)
-        
-        vel_x = bullet_speed * math.cos(angle_rad)
-        vel_y = bullet_speed * math.sin(angle_rad)
+        # ultimate_angle advances in 30-degree steps, so it indexes the table
+        vel_x, vel_y = BossEnemy._ULTIMATE_VELOCITIES[(self.ultimate_angle // 30) % 12]
         
         bullet = BossBullet(center_x, center_y, vel_x, vel_y)
-        self.bullets.add(bullet)
+        self.bullets.append(bullet)
     
     def get_bullets(self):
-        """Return the bullets sprite group for collision detection."""
+        """Return the list of boss bullets for collision detection."""
         return self.bullets
     
-    def draw(self, screen, camera_x=0, camera_y=0):
-        """Draw the boss and its bullets."""
-        # Draw bullets first (behind boss)
-        for bullet in self.bullets:
-            bullet.draw(screen, camera_x, camera_y)
-        
-        # Draw boss (calls parent draw which includes eye)
-        super().draw(screen, camera_x, camera_y)
\ No newline at end of file
+    def get_blit_items(self, camera_x=0, camera_y=0):
+        """Return the boss bullets' blit items followed by the boss itself."""
+        # Bullets first so they are drawn behind the boss
+        items = [(bullet.image, (bullet.rect.x - camera_x, bullet.rect.y - camera_y))
+                 for bullet in self.bullets if bullet.active]
+        items.extend(super().get_blit_items(camera_x, camera_y))
+        return items
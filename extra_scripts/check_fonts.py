@@ -2,10 +2,71 @@
 Script to check available fonts on the system.
 """
 
+import json
 import os
 import platform
+import re
 from PIL import ImageFont
 
+# Categorizes a font file name in one pass; the lookahead lets 'bold' anywhere
+# in the name win over a monospace match earlier in it
+FONT_CATEGORY_PATTERN = re.compile(r'(?P<bold>^(?=.*bold))|(?P<mono>mono|consola|courier)', re.IGNORECASE)
+
+# Font list from the last scan, reused while no scanned directory has changed
+FONT_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".font_scan_cache.json")
+
+def scan_font_dirs(font_dirs):
+    """Return (font paths, {directory: mtime_ns}) for every directory scanned.
+    
+    Walks the directories with os.scandir, which gets file types from the
+    directory listing itself instead of a stat call per entry.
+    """
+    fonts = []
+    dir_mtimes = {}
+    stack = [font_dir for font_dir in font_dirs if os.path.isdir(font_dir)]
+    while stack:
+        path = stack.pop()
+        try:
+            dir_mtimes[path] = os.stat(path).st_mtime_ns
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.lower().endswith(('.ttf', '.otf')) and entry.is_file():
+                        fonts.append(entry.path)
+        except OSError:
+            continue
+    # Overlapping font directories would list the same file twice
+    return list(dict.fromkeys(fonts)), dir_mtimes
+
+def load_cached_fonts(font_dirs):
+    """Return the cached font list if none of its directories changed, else None."""
+    try:
+        with open(FONT_CACHE_PATH, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+        if cache["font_dirs"] != [d for d in font_dirs if os.path.isdir(d)]:
+            return None
+        # Adding or removing a file updates its directory's mtime
+        for path, mtime_ns in cache["dir_mtimes"].items():
+            if os.stat(path).st_mtime_ns != mtime_ns:
+                return None
+        return cache["fonts"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+def save_cached_fonts(font_dirs, fonts, dir_mtimes):
+    """Write the scan result to the font cache, ignoring write failures."""
+    cache = {
+        "font_dirs": [d for d in font_dirs if os.path.isdir(d)],
+        "dir_mtimes": dir_mtimes,
+        "fonts": fonts,
+    }
+    try:
+        with open(FONT_CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+
 def get_available_fonts():
     """Get a list of available fonts on the system."""
     
@@ -30,13 +91,10 @@ def get_available_fonts():
             os.path.expanduser("~/.fonts")
         ]
     
-    fonts = []
-    for font_dir in font_dirs:
-        if os.path.exists(font_dir):
-            for root, dirs, files in os.walk(font_dir):
-                for file in files:
-                    if file.lower().endswith(('.ttf', '.otf')):
-                        fonts.append(os.path.join(root, file))
+    fonts = load_cached_fonts(font_dirs)
+    if fonts is None:
+        fonts, dir_mtimes = scan_font_dirs(font_dirs)
+        save_cached_fonts(font_dirs, fonts, dir_mtimes)
     
     # Print fonts by category
     print("=" * 70)
@@ -50,14 +108,14 @@ def get_available_fonts():
     
     for font in sorted(fonts):
         font_name = os.path.basename(font)
-        font_lower = font_name.lower()
         
-        if 'bold' in font_lower:
+        match = FONT_CATEGORY_PATTERN.search(font_name)
+        if match is None:
+            regular_fonts.append((font_name, font))
+        elif match.lastgroup == 'bold':
             bold_fonts.append((font_name, font))
-        elif 'mono' in font_lower or 'consola' in font_lower or 'courier' in font_lower:
-            mono_fonts.append((font_name, font))
         else:
-            regular_fonts.append((font_name, font))
+            mono_fonts.append((font_name, font))
     
     print("\n📌 BEST FOR RPG GAMES (Bold/Heavy fonts):")
     print("-" * 70)
@@ -112,15 +170,16 @@ def get_available_fonts():
         "georgiab.ttf", # Georgia Bold
     ]
     
+    # Lowercase every path once instead of once per test font
+    lower_paths = [font_path.lower() for font_path in fonts]
     for test_font in test_fonts:
-        found = False
-        for font_path in fonts:
-            if test_font.lower() in font_path.lower():
-                print(f"\n  ✅ {test_font} FOUND")
-                print(f"     Path: {font_path}")
-                found = True
-                break
-        if not found:
+        test_lower = test_font.lower()
+        font_path = next((path for path, lower_path in zip(fonts, lower_paths)
+                          if test_lower in lower_path), None)
+        if font_path is not None:
+            print(f"\n  ✅ {test_font} FOUND")
+            print(f"     Path: {font_path}")
+        else:
             print(f"\n  ❌ {test_font} NOT FOUND")
 
 if __name__ == "__main__":
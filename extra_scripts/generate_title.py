@@ -3,8 +3,45 @@ Script to generate a pixelated RPG-style title image for the game.
 """
 
 from PIL import Image, ImageDraw, ImageFont
+from functools import lru_cache
 import os
 
+# Bold monospace or pixel-like fonts to try for the title, in order of preference
+TITLE_FONT_NAMES = ("CascadiaMono.ttf", "Arial Bold.ttf")
+
+# Remembers which of TITLE_FONT_NAMES loaded last time, so later runs try it first
+FONT_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".font_cache")
+
+@lru_cache(maxsize=8)
+def load_title_font(size):
+    """Return the first title font that loads at this size, or PIL's default font."""
+    names = list(TITLE_FONT_NAMES)
+    cached_name = None
+    try:
+        with open(FONT_CACHE_PATH, "r", encoding="utf-8") as f:
+            cached_name = f.read().strip()
+        if cached_name in names:
+            names.remove(cached_name)
+            names.insert(0, cached_name)
+    except OSError:
+        pass
+    
+    for name in names:
+        try:
+            font = ImageFont.truetype(name, size)
+        except OSError:
+            continue
+        if name != cached_name:
+            try:
+                with open(FONT_CACHE_PATH, "w", encoding="utf-8") as f:
+                    f.write(name)
+            except OSError:
+                pass
+        return font
+    
+    # Fallback to default font
+    return ImageFont.load_default()
+
 def create_pixelated_title():
     """Create a pixelated RPG-style title image."""
     
@@ -21,15 +58,7 @@ def create_pixelated_title():
     
     # Try to use a bold system font, fallback to default
     font_size = 80
-    try:
-        # Try to find a bold monospace or pixel-like font
-        font = ImageFont.truetype("CascadiaMono.ttf", font_size)
-    except:
-        try:
-            font = ImageFont.truetype("Arial Bold.ttf", font_size)
-        except:
-            # Fallback to default font
-            font = ImageFont.load_default()
+    font = load_title_font(font_size)
     
     # Get text bounding box for centering
     bbox = draw.textbbox((0, 0), title_text, font=font)
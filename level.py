@@ -5,8 +5,69 @@ Handles level generation, background, obstacles, and progression.
 
 import pygame
 import csv
+import math
 import os
 import random
+from bisect import bisect_left, bisect_right
+
+
+class TileGrid:
+    """Row-bucketed spatial index over tile rects for fast neighbourhood queries.
+
+    Tiles are grouped into horizontal rows `cell_size` pixels tall, and each
+    row is kept sorted by x. A query bisects every row the rect spans down to
+    the slice of tiles whose x-range overlaps it, so the cost is
+    O(rows * log n + k) instead of a scan over every tile. Tiles within a row
+    must not overlap each other (always true for CSV tilemaps). Tiles are
+    returned in row-major order, matching the order they were loaded from the CSV.
+    """
+
+    def __init__(self, tiles, cell_size=64):
+        self.cell_size = cell_size
+        self.rows = {}  # dict of row index -> list of pygame.Rect sorted by left
+        self.row_lefts = {}  # dict of row index -> sorted list of tile.left
+        self.row_rights = {}  # dict of row index -> sorted list of tile.right
+        for tile in tiles:
+            self.add(tile)
+
+    def add(self, tile):
+        """Insert a tile rect into every row it overlaps, keeping rows sorted by x."""
+        cell_size = self.cell_size
+        for row_index in range(tile.top // cell_size, (tile.bottom - 1) // cell_size + 1):
+            lefts = self.row_lefts.setdefault(row_index, [])
+            index = bisect_right(lefts, tile.left)
+            lefts.insert(index, tile.left)
+            self.row_rights.setdefault(row_index, []).insert(index, tile.right)
+            self.rows.setdefault(row_index, []).insert(index, tile)
+
+    def remove(self, tile):
+        """Remove a tile rect from every row it overlaps."""
+        cell_size = self.cell_size
+        for row_index in range(tile.top // cell_size, (tile.bottom - 1) // cell_size + 1):
+            row = self.rows.get(row_index)
+            if not row:
+                continue
+            index = bisect_left(self.row_lefts[row_index], tile.left)
+            if index < len(row) and row[index] == tile:
+                del row[index]
+                del self.row_lefts[row_index][index]
+                del self.row_rights[row_index][index]
+
+    def query(self, rect):
+        """Return the tiles in the rows spanned by `rect` whose x-range overlaps it."""
+        cell_size = self.cell_size
+        rows = self.rows
+        left, right = rect.left, rect.right
+        found = []
+        for row_index in range(rect.top // cell_size, (rect.bottom - 1) // cell_size + 1):
+            row = rows.get(row_index)
+            if row:
+                # Rights are sorted too because tiles in a row never overlap
+                start = bisect_right(self.row_rights[row_index], left)
+                end = bisect_left(self.row_lefts[row_index], right)
+                if start < end:
+                    found.extend(row[start:end])
+        return found
 
 
 class Level:
@@ -43,6 +104,15 @@ class Level:
             print(f"Warning: Could not load crystal sprite from {crystal_path}")
             self.crystal_sprite = None
 
+        # Image blitted for every uncollected crystal, and its offset from the
+        # collectible's top-left; without the sprite, a rhombus is pre-rendered
+        if self.crystal_sprite:
+            self.crystal_image = self.crystal_sprite
+            self.crystal_offset = (0, 0)
+        else:
+            self.crystal_image, self.crystal_offset = self.build_crystal_image(
+                self.tile_size // 2, self.tile_size // 2)
+
         # Storage for tiles
         self.tiles = []  # 2D list of tile codes
         self.solid_tiles = []  # list of pygame.Rect for G and D (ground and dirt)
@@ -51,10 +121,16 @@ class Level:
         self.cobblestone_tiles = []  # list of pygame.Rect for S (cobblestone) specifically
         self.removable_tiles = []  # list of pygame.Rect for R (removable wooden planks)
         self.one_way_tiles = []  # list of pygame.Rect for P (platform)
+        self.all_tiles = []  # solid_tiles + one_way_tiles, merged once after loading
         self.collectibles = []  # list of dicts: {'rect': Rect, 'collected': False}
+        self.collected_count = 0  # collectibles marked collected, kept by collect_items
         self.enemy_spawns = []  # list of dicts: {'x': x, 'y': y, 'type': enemy_type}
         self.player_spawn_point = None  # tuple (x, y) for X (player spawn)
         self.exit_rect = None  # pygame.Rect for E (exit door)
+        self.ground_strips = []  # ground_tiles merged into horizontal runs (drawing only)
+        self.solid_grid = None  # TileGrid over solid_tiles
+        self.one_way_grid = None  # TileGrid over one_way_tiles
+        self.column_tops = []  # per column: highest tile top in all_tiles, capped at height - 100
         
         # Boss defeat tracking
         self.boss_defeated = False
@@ -66,6 +142,15 @@ class Level:
         # Load CSV and build tile lists
         self.load_from_csv(self.csv_path)
 
+        # One pre-rendered image per tile type for draw(), and the drawn tiles
+        # grouped by column so draw() only visits on-screen columns
+        self.tile_images = {}
+        self.tile_columns = []  # per column: list of (image, rect) to draw
+        self.exit_images = None  # (locked, unlocked) door images, rendered on first draw
+        self.exit_image_offset = (0, 0)  # door image top-left relative to exit_rect
+        self.build_tile_images()
+        self.build_tile_columns()
+
         # Decorations (clouds/grass) are optional
         self.decorations = []
         self.generate_decorations()
@@ -87,7 +172,9 @@ class Level:
         self.cobblestone_tiles = []
         self.removable_tiles = []
         self.one_way_tiles = []
+        self.all_tiles = []
         self.collectibles = []
+        self.collected_count = 0
         self.enemy_spawns = []
         self.player_spawn_point = None
         self.exit_rect = None
@@ -125,68 +212,105 @@ class Level:
         self.width = self.cols * self.tile_size
         self.height = self.rows * self.tile_size
 
-        # Build rect lists
+        # Build rect lists: one handler per tile code, called with the
+        # tile's top-left pixel position
+        tile_size = self.tile_size
+        half_tile = tile_size // 2
+
+        def add_solid(kind_tiles):
+            def handler(x, y):
+                rect = pygame.Rect(x, y, tile_size, tile_size)
+                self.solid_tiles.append(rect)
+                kind_tiles.append(rect)
+            return handler
+
+        def add_platform(x, y):
+            # Make platforms thin - only 8 pixels thick at the top
+            platform_thickness = 8
+            self.one_way_tiles.append(pygame.Rect(x, y, tile_size, platform_thickness))
+
+        def add_collectible(x, y):
+            # collectible sits centered on tile
+            rect = pygame.Rect(x + tile_size//4, y + tile_size//4, half_tile, half_tile)
+            self.collectibles.append({'rect': rect, 'collected': False})
+
+        def add_enemy_spawn(enemy_type):
+            def handler(x, y):
+                self.enemy_spawns.append({'x': x + half_tile, 'y': y + half_tile, 'type': enemy_type})
+            return handler
+
+        def set_player_spawn(x, y):
+            self.player_spawn_point = (x + half_tile, y + half_tile)
+
+        def set_exit(x, y):
+            # Exit door - full tile size
+            self.exit_rect = pygame.Rect(x, y, tile_size, tile_size)
+
+        handlers = {
+            'G': add_solid(self.ground_tiles),
+            'D': add_solid(self.dirt_tiles),  # same collision as ground, different look
+            'S': add_solid(self.cobblestone_tiles),  # cracked stone appearance
+            'R': add_solid(self.removable_tiles),  # wooden planks, removed after boss defeat
+            'P': add_platform,
+            'C': add_collectible,
+            'B': add_enemy_spawn('basic'),
+            'J': add_enemy_spawn('jumping'),
+            'A': add_enemy_spawn('ambush'),
+            'Z': add_enemy_spawn('boss'),
+            'X': set_player_spawn,
+            'E': set_exit,
+        }
+
+        # Scan in row-major order; merge_tile_runs relies on it
         for r_index, row in enumerate(self.tiles):
+            y = r_index * tile_size
             for c_index, code in enumerate(row):
-                x = c_index * self.tile_size
-                y = r_index * self.tile_size
-                if code == 'G':
-                    rect = pygame.Rect(x, y, self.tile_size, self.tile_size)
-                    self.solid_tiles.append(rect)
-                    self.ground_tiles.append(rect)
-                elif code == 'D':
-                    # Dirt block - same collision as ground but different appearance
-                    rect = pygame.Rect(x, y, self.tile_size, self.tile_size)
-                    self.solid_tiles.append(rect)
-                    self.dirt_tiles.append(rect)
-                elif code == 'S':
-                    # Cobblestone - solid tile with cracked stone appearance
-                    rect = pygame.Rect(x, y, self.tile_size, self.tile_size)
-                    self.solid_tiles.append(rect)
-                    self.cobblestone_tiles.append(rect)
-                elif code == 'R':
-                    # Removable wooden planks - removed after boss defeat
-                    rect = pygame.Rect(x, y, self.tile_size, self.tile_size)
-                    self.solid_tiles.append(rect)
-                    self.removable_tiles.append(rect)
-                elif code == 'P':
-                    # Make platforms thin - only 8 pixels thick at the top
-                    platform_thickness = 8
-                    rect = pygame.Rect(x, y, self.tile_size, platform_thickness)
-                    self.one_way_tiles.append(rect)
-                elif code == 'C':
-                    # collectible sits centered on tile
-                    rect = pygame.Rect(x + self.tile_size//4, y + self.tile_size//4,
-                                       self.tile_size//2, self.tile_size//2)
-                    self.collectibles.append({'rect': rect, 'collected': False})
-                elif code == 'B':
-                    # BasicEnemy spawn point
-                    spawn_x = x + self.tile_size // 2
-                    spawn_y = y + self.tile_size // 2
-                    self.enemy_spawns.append({'x': spawn_x, 'y': spawn_y, 'type': 'basic'})
-                elif code == 'J':
-                    # JumpingEnemy spawn point
-                    spawn_x = x + self.tile_size // 2
-                    spawn_y = y + self.tile_size // 2
-                    self.enemy_spawns.append({'x': spawn_x, 'y': spawn_y, 'type': 'jumping'})
-                elif code == 'A':
-                    # AmbushEnemy spawn point
-                    spawn_x = x + self.tile_size // 2
-                    spawn_y = y + self.tile_size // 2
-                    self.enemy_spawns.append({'x': spawn_x, 'y': spawn_y, 'type': 'ambush'})
-                elif code == 'Z':
-                    # BossEnemy spawn point
-                    spawn_x = x + self.tile_size // 2
-                    spawn_y = y + self.tile_size // 2
-                    self.enemy_spawns.append({'x': spawn_x, 'y': spawn_y, 'type': 'boss'})
-                elif code == 'X':
-                    # Player spawn point
-                    spawn_x = x + self.tile_size // 2
-                    spawn_y = y + self.tile_size // 2
-                    self.player_spawn_point = (spawn_x, spawn_y)
-                elif code == 'E':
-                    # Exit door - full tile size
-                    self.exit_rect = pygame.Rect(x, y, self.tile_size, self.tile_size)
+                # Most cells are empty; skip them before the handler lookup
+                if code == '.':
+                    continue
+                handler = handlers.get(code)
+                if handler is not None:
+                    handler(c_index * tile_size, y)
+
+        # Runs of horizontally adjacent ground tiles, for drawing the background
+        self.ground_strips = self.merge_tile_runs(self.ground_tiles)
+
+        # Merge solid and one-way tiles once for consumers that treat them alike
+        self.all_tiles = self.solid_tiles + self.one_way_tiles
+
+        # Spatial grids for fast tile lookups during collision checks
+        self.solid_grid = TileGrid(self.solid_tiles, self.tile_size)
+        self.one_way_grid = TileGrid(self.one_way_tiles, self.tile_size)
+
+        # Per-column highest tile for get_highest_ground_y
+        self.build_column_tops()
+
+    @staticmethod
+    def merge_tile_runs(tiles):
+        """Merge horizontally adjacent tiles of a row-major tile list into strip Rects."""
+        strips = []
+        for rect in tiles:
+            if strips:
+                last = strips[-1]
+                if last.right == rect.left and last.top == rect.top and last.height == rect.height:
+                    last.width += rect.width
+                    continue
+            strips.append(rect.copy())
+        return strips
+
+    def build_column_tops(self):
+        """Record the highest tile top in each column of all_tiles.
+
+        Columns start at get_highest_ground_y's fallback (height - 100), so a
+        query is just the minimum over a slice of this list.
+        """
+        tile_size = self.tile_size
+        column_tops = [self.height - 100] * self.cols
+        for rect in self.all_tiles:
+            column = rect.centerx // tile_size
+            if rect.top < column_tops[column]:
+                column_tops[column] = rect.top
+        self.column_tops = column_tops
     
     def generate_decorations(self):
         """Generate simple clouds and grass decorations."""
@@ -196,7 +320,8 @@ class Level:
             x = random.randint(0, max(0, self.width - 80))
             y = random.randint(50, 200)
             size = random.randint(30, 60)
-            decoration = {'pos': (x, y), 'size': size, 'color': (255, 255, 255), 'type': 'cloud'}
+            decoration = {'pos': (x, y), 'size': size, 'color': (255, 255, 255), 'type': 'cloud',
+                          'circles': self.get_cloud_circles(size)}
             self.decorations.append(decoration)
 
         # Small grass decorations above ground tiles only (not dirt)
@@ -205,6 +330,23 @@ class Level:
                 decoration = {'pos': (rect.x + 8, rect.y - 8), 'size': 6, 'color': (34, 139, 34), 'type': 'grass'}
                 self.decorations.append(decoration)
     
+    @staticmethod
+    def get_cloud_circles(size):
+        """Return the (color, x offset, y offset, radius) circles that draw a cloud of this size."""
+        return (
+            # Larger clouds with varied colors (white to grayish-white)
+            # Base layer (larger circles)
+            ((240, 240, 240), size//2, size//2, size//2),
+            ((230, 230, 230), size//4, size//2 + 5, size//3),
+            ((250, 250, 250), size*3//4, size//2 + 5, size//3),
+            # Top layer (smaller circles for puffiness)
+            ((255, 255, 255), size//2, size//3, size//3),
+            ((245, 245, 245), size//3, size//2 - 5, size//4),
+            ((255, 255, 255), size*2//3, size//2 - 5, size//4),
+            # Extra small puffs
+            ((250, 250, 250), size*5//6, size//2, size//6),
+        )
+    
     def generate_trees(self):
         """Generate background trees with parallax effect."""
         self.trees = []
@@ -242,26 +384,27 @@ class Level:
         # Lift background ground to show distance
         vertical_offset = - 20  # Lift by 80 pixels to show it's in the distance
         
-        # Draw ground tiles with parallax in the background
-        tile_width = 64
-        tile_height = 64
+        # Draw ground strips (runs of ground tiles) with parallax in the background
+        screen_width = screen.get_width()
+        tile_size = self.tile_size
         
-        for rect in self.ground_tiles:
-            # Apply parallax to x position only
-            bg_x = rect.x - parallax_x
-            bg_y = rect.y - camera_y + vertical_offset
+        for strip in self.ground_strips:
+            # Apply parallax to x position only. The strip spans its first to
+            # its last tile, each truncated like the Rect constructor did with
+            # the tile's float x
+            left = int(strip.left - parallax_x)
+            right = int(strip.right - tile_size - parallax_x) + tile_size
+            bg_y = strip.y - camera_y + vertical_offset
             
-            # Only draw if within screen bounds (with buffer)
-            if -tile_width < bg_x < screen.get_width() + tile_width:
-                # Calculate height from this tile to bottom of level
-                height_to_bottom = self.height - rect.y - vertical_offset
+            # Only draw if within screen bounds
+            if right > 0 and left < screen_width:
+                # Calculate height from this strip to bottom of level
+                height_to_bottom = self.height - strip.y - vertical_offset
                 
-                screen_rect = pygame.Rect(bg_x, bg_y, rect.width, height_to_bottom)
                 # Draw darker brown ground extending to bottom
-                pygame.draw.rect(screen, bg_brown, screen_rect)
+                pygame.draw.rect(screen, bg_brown, (left, bg_y, right - left, height_to_bottom))
                 # Draw darker grass on top edge only
-                grass_rect = pygame.Rect(bg_x, bg_y, rect.width, 4)
-                pygame.draw.rect(screen, bg_grass, grass_rect)
+                pygame.draw.rect(screen, bg_grass, (left, bg_y, right - left, 4))
     
     def draw_tree(self, screen, screen_x, screen_y, tree):
         """Draw a single tree at the given position."""
@@ -272,8 +415,7 @@ class Level:
         # Draw trunk
         trunk_x = int(screen_x - tree['trunk_width'] // 2)
         trunk_y = int(screen_y - tree['height'])
-        trunk_rect = pygame.Rect(trunk_x, trunk_y, tree['trunk_width'], tree['height'])
-        pygame.draw.rect(screen, trunk_color, trunk_rect)
+        pygame.draw.rect(screen, trunk_color, (trunk_x, trunk_y, tree['trunk_width'], tree['height']))
         
         # Draw canopy (3 overlapping circles for fuller look)
         canopy_y = int(screen_y - tree['height'] + 20)
@@ -289,6 +431,197 @@ class Level:
         pygame.draw.circle(screen, canopy_color, 
                          (int(screen_x), canopy_y - 10), radius)
     
+    def build_tile_images(self):
+        """Pre-render one image per tile type, used by draw() for every tile of that type."""
+        tile_size = self.tile_size
+        
+        # Ground: brown with grass on top
+        ground = pygame.Surface((tile_size, tile_size)).convert()
+        ground.fill((139, 69, 19))
+        pygame.draw.rect(ground, (34, 139, 34), (0, 0, tile_size, 4))
+        
+        # Dirt: plain brown, no grass
+        dirt = pygame.Surface((tile_size, tile_size)).convert()
+        dirt.fill((139, 69, 19))
+        
+        cobblestone = pygame.Surface((tile_size, tile_size)).convert()
+        self.draw_cobblestone(cobblestone, cobblestone.get_rect())
+        
+        planks = pygame.Surface((tile_size, tile_size)).convert()
+        self.draw_planks(planks, planks.get_rect())
+        
+        # Platforms are only 8 pixels thick (see load_from_csv)
+        platform = pygame.Surface((tile_size, 8)).convert()
+        platform_rect = platform.get_rect()
+        pygame.draw.rect(platform, (160, 82, 45), platform_rect)
+        pygame.draw.rect(platform, (101, 67, 33), platform_rect, 2)
+        
+        self.tile_images = {'G': ground, 'D': dirt, 'S': cobblestone, 'R': planks, 'P': platform}
+    
+    def build_tile_columns(self):
+        """Group the tiles to draw by column as (image, rect) pairs.
+
+        Tiles never share a grid cell, so the order within a column doesn't
+        matter. Removable wooden planks are only drawn until the boss is defeated.
+        """
+        tile_size = self.tile_size
+        tile_images = self.tile_images
+        draw_lists = [('G', self.ground_tiles), ('D', self.dirt_tiles), ('S', self.cobblestone_tiles)]
+        if not self.boss_defeated:
+            draw_lists.append(('R', self.removable_tiles))
+        draw_lists.append(('P', self.one_way_tiles))
+        
+        tile_columns = [[] for _ in range(self.cols)]
+        for code, rects in draw_lists:
+            image = tile_images[code]
+            for rect in rects:
+                tile_columns[rect.x // tile_size].append((image, rect))
+        self.tile_columns = tile_columns
+    
+    @staticmethod
+    def draw_cobblestone(surface, screen_rect):
+        """Draw a cobblestone tile (stone with cracks) into screen_rect."""
+        # Base stone color (gray)
+        pygame.draw.rect(surface, (120, 120, 130), screen_rect)
+        
+        # Draw darker border for depth
+        pygame.draw.rect(surface, (80, 80, 90), screen_rect, 3)
+        
+        # Draw cracks for cobbled look
+        crack_color = (70, 70, 80)
+        
+        # Vertical crack (left side)
+        pygame.draw.line(surface, crack_color, 
+                       (screen_rect.x + 8, screen_rect.y + 5),
+                       (screen_rect.x + 6, screen_rect.y + 25), 2)
+        
+        # Diagonal crack (middle)
+        pygame.draw.line(surface, crack_color,
+                       (screen_rect.x + 20, screen_rect.y + 10),
+                       (screen_rect.x + 45, screen_rect.y + 30), 2)
+        
+        # Horizontal crack (bottom)
+        pygame.draw.line(surface, crack_color,
+                       (screen_rect.x + 15, screen_rect.y + 50),
+                       (screen_rect.x + 40, screen_rect.y + 48), 2)
+        
+        # Small crack (top right)
+        pygame.draw.line(surface, crack_color,
+                       (screen_rect.x + 50, screen_rect.y + 8),
+                       (screen_rect.x + 55, screen_rect.y + 15), 2)
+        
+        # Add subtle texture spots
+        texture_color = (100, 100, 110)
+        pygame.draw.circle(surface, texture_color, 
+                         (screen_rect.x + 30, screen_rect.y + 20), 3)
+        pygame.draw.circle(surface, texture_color,
+                         (screen_rect.x + 15, screen_rect.y + 40), 2)
+        pygame.draw.circle(surface, texture_color,
+                         (screen_rect.x + 50, screen_rect.y + 35), 2)
+    
+    @staticmethod
+    def draw_planks(surface, screen_rect):
+        """Draw a removable wooden plank tile into screen_rect."""
+        # Base wood color (light brown)
+        pygame.draw.rect(surface, (160, 120, 80), screen_rect)
+        
+        # Draw darker wood grain lines (horizontal planks)
+        plank_color = (120, 90, 60)
+        for i in range(4):
+            y_offset = i * 16
+            pygame.draw.line(surface, plank_color,
+                           (screen_rect.x, screen_rect.y + y_offset),
+                           (screen_rect.x + screen_rect.width, screen_rect.y + y_offset), 2)
+        
+        # Draw vertical wood grain details
+        for i in range(5):
+            x_offset = i * 13
+            pygame.draw.line(surface, plank_color,
+                           (screen_rect.x + x_offset, screen_rect.y),
+                           (screen_rect.x + x_offset, screen_rect.y + screen_rect.height), 1)
+        
+        # Draw nails/bolts at corners
+        nail_color = (80, 80, 80)
+        pygame.draw.circle(surface, nail_color,
+                         (screen_rect.x + 8, screen_rect.y + 8), 3)
+        pygame.draw.circle(surface, nail_color,
+                         (screen_rect.x + screen_rect.width - 8, screen_rect.y + 8), 3)
+        pygame.draw.circle(surface, nail_color,
+                         (screen_rect.x + 8, screen_rect.y + screen_rect.height - 8), 3)
+        pygame.draw.circle(surface, nail_color,
+                         (screen_rect.x + screen_rect.width - 8, screen_rect.y + screen_rect.height - 8), 3)
+        
+        # Draw border for temporary look
+        pygame.draw.rect(surface, (100, 70, 40), screen_rect, 2)
+    
+    @staticmethod
+    def build_crystal_image(width, height):
+        """Pre-render the fallback rhombus crystal for a width x height collectible.
+        
+        Returns (image, offset): the image has a small margin for the outline,
+        so blit it at the collectible's top-left plus offset.
+        """
+        margin = 2
+        image = pygame.Surface((width + 2 * margin + 1, height + 2 * margin + 1), pygame.SRCALPHA)
+        center_x = margin + width // 2
+        center_y = margin + height // 2
+        half_w = width // 2
+        half_h = height // 2
+        
+        # Rhombus points: top, right, bottom, left
+        crystal_points = [
+            (center_x, center_y - half_h),  # top
+            (center_x + half_w, center_y),   # right
+            (center_x, center_y + half_h),   # bottom
+            (center_x - half_w, center_y)    # left
+        ]
+        # Draw filled crystal (cyan/light blue)
+        pygame.draw.polygon(image, (0, 255, 255), crystal_points)
+        # Draw crystal outline (darker blue)
+        pygame.draw.polygon(image, (0, 150, 200), crystal_points, 2)
+        # Add shine effect
+        shine_points = [
+            (center_x - half_w // 3, center_y - half_h // 3),
+            (center_x, center_y - half_h // 2),
+            (center_x - half_w // 4, center_y)
+        ]
+        pygame.draw.polygon(image, (200, 255, 255), shine_points)
+        return image.convert_alpha(), (-margin, -margin)
+    
+    def get_exit_image(self, unlocked):
+        """Return the pre-rendered door image: unlocked with "EXIT", or locked.
+        
+        Both variants are composited once on first use. The "LOCKED" label is
+        wider than a tile, so the images may extend past the door; blit them
+        at exit_rect.topleft offset by exit_image_offset.
+        """
+        if self.exit_images is None:
+            font = pygame.font.Font(None, 24)
+            door_rect = pygame.Rect(0, 0, self.tile_size, self.tile_size)
+            variants = (
+                # (label, label color, door color, handle color)
+                (font.render("LOCKED", True, (200, 200, 200)), (100, 100, 100), (150, 150, 150)),
+                (font.render("EXIT", True, (255, 255, 255)), (139, 90, 43), (218, 165, 32)),
+            )
+            bounds = door_rect.unionall([text.get_rect(center=door_rect.center)
+                                         for text, _, _ in variants])
+            local_rect = door_rect.move(-bounds.x, -bounds.y)
+            
+            images = []
+            for text, door_color, handle_color in variants:
+                image = pygame.Surface(bounds.size, pygame.SRCALPHA)
+                # Door frame (dark wood), then the door itself
+                pygame.draw.rect(image, (101, 67, 33), local_rect)
+                pygame.draw.rect(image, door_color, local_rect.inflate(-8, -8))
+                # Door handle
+                pygame.draw.circle(image, handle_color,
+                                   (local_rect.right - 15, local_rect.centery), 4)
+                image.blit(text, text.get_rect(center=local_rect.center))
+                images.append(image.convert_alpha())
+            self.exit_images = tuple(images)
+            self.exit_image_offset = bounds.topleft
+        return self.exit_images[bool(unlocked)]
+    
     def remove_boss_tiles(self):
         """Remove all removable tiles after boss is defeated."""
         if not self.boss_defeated:
@@ -297,6 +630,10 @@ class Level:
             for tile in self.removable_tiles:
                 if tile in self.solid_tiles:
                     self.solid_tiles.remove(tile)
+                    self.all_tiles.remove(tile)
+                    self.solid_grid.remove(tile)
+            self.build_column_tops()
+            self.build_tile_columns()
             print("Boss defeated! Removable tiles have been removed.")
     
     def update(self):
@@ -306,7 +643,7 @@ class Level:
         pass
     
     def draw(self, screen, camera_x=0, camera_y=0):
-        """Draw the entire level to the screen with camera offset (no visibility culling)."""
+        """Draw the level to the screen with camera offset, skipping off-screen tile columns."""
         # Draw background
         screen.fill(self.background_color)
         
@@ -330,192 +667,35 @@ class Level:
             screen_x = pos_x - camera_x
             screen_y = pos_y - camera_y
             if decoration['type'] == 'cloud':
-                size = decoration['size']
-                # Draw larger clouds with varied colors (white to grayish-white)
-                # Base layer (larger circles)
-                pygame.draw.circle(screen, (240, 240, 240), (screen_x + size//2, screen_y + size//2), size//2)
-                pygame.draw.circle(screen, (230, 230, 230), (screen_x + size//4, screen_y + size//2 + 5), size//3)
-                pygame.draw.circle(screen, (250, 250, 250), (screen_x + size*3//4, screen_y + size//2 + 5), size//3)
-                # Top layer (smaller circles for puffiness)
-                pygame.draw.circle(screen, (255, 255, 255), (screen_x + size//2, screen_y + size//3), size//3)
-                pygame.draw.circle(screen, (245, 245, 245), (screen_x + size//3, screen_y + size//2 - 5), size//4)
-                pygame.draw.circle(screen, (255, 255, 255), (screen_x + size*2//3, screen_y + size//2 - 5), size//4)
-                # Extra small puffs
-                pygame.draw.circle(screen, (250, 250, 250), (screen_x + size*5//6, screen_y + size//2), size//6)
+                # Circle offsets and radii are precomputed per cloud (get_cloud_circles)
+                for color, offset_x, offset_y, radius in decoration['circles']:
+                    pygame.draw.circle(screen, color, (screen_x + offset_x, screen_y + offset_y), radius)
             elif decoration['type'] == 'grass':
                 for i in range(3):
                     pygame.draw.line(screen, decoration['color'], (screen_x + i*3, screen_y), (screen_x + i*3, screen_y - 5), 2)
 
-        # Draw ground tiles (brown with grass on top)
-        for rect in self.ground_tiles:
-            screen_rect = pygame.Rect(rect.x - camera_x, rect.y - camera_y, rect.width, rect.height)
-            pygame.draw.rect(screen, (139, 69, 19), screen_rect)
-            grass_rect = pygame.Rect(screen_rect.x, screen_rect.y, screen_rect.width, 4)
-            pygame.draw.rect(screen, (34, 139, 34), grass_rect)
-
-        # Draw dirt tiles (plain brown, no grass)
-        for rect in self.dirt_tiles:
-            screen_rect = pygame.Rect(rect.x - camera_x, rect.y - camera_y, rect.width, rect.height)
-            pygame.draw.rect(screen, (139, 69, 19), screen_rect)  # Darker brown for dirt
-        
-        # Draw cobblestone tiles (stone with cracks)
-        for rect in self.cobblestone_tiles:
-            screen_rect = pygame.Rect(rect.x - camera_x, rect.y - camera_y, rect.width, rect.height)
-            
-            # Base stone color (gray)
-            pygame.draw.rect(screen, (120, 120, 130), screen_rect)
-            
-            # Draw darker border for depth
-            pygame.draw.rect(screen, (80, 80, 90), screen_rect, 3)
-            
-            # Draw cracks for cobbled look
-            crack_color = (70, 70, 80)
-            
-            # Vertical crack (left side)
-            pygame.draw.line(screen, crack_color, 
-                           (screen_rect.x + 8, screen_rect.y + 5),
-                           (screen_rect.x + 6, screen_rect.y + 25), 2)
-            
-            # Diagonal crack (middle)
-            pygame.draw.line(screen, crack_color,
-                           (screen_rect.x + 20, screen_rect.y + 10),
-                           (screen_rect.x + 45, screen_rect.y + 30), 2)
-            
-            # Horizontal crack (bottom)
-            pygame.draw.line(screen, crack_color,
-                           (screen_rect.x + 15, screen_rect.y + 50),
-                           (screen_rect.x + 40, screen_rect.y + 48), 2)
-            
-            # Small crack (top right)
-            pygame.draw.line(screen, crack_color,
-                           (screen_rect.x + 50, screen_rect.y + 8),
-                           (screen_rect.x + 55, screen_rect.y + 15), 2)
-            
-            # Add subtle texture spots
-            texture_color = (100, 100, 110)
-            pygame.draw.circle(screen, texture_color, 
-                             (screen_rect.x + 30, screen_rect.y + 20), 3)
-            pygame.draw.circle(screen, texture_color,
-                             (screen_rect.x + 15, screen_rect.y + 40), 2)
-            pygame.draw.circle(screen, texture_color,
-                             (screen_rect.x + 50, screen_rect.y + 35), 2)
-        
-        # Draw removable wooden plank tiles (only if not removed yet)
-        if not self.boss_defeated:
-            for rect in self.removable_tiles:
-                screen_rect = pygame.Rect(rect.x - camera_x, rect.y - camera_y, rect.width, rect.height)
-                
-                # Base wood color (light brown)
-                pygame.draw.rect(screen, (160, 120, 80), screen_rect)
-                
-                # Draw darker wood grain lines (horizontal planks)
-                plank_color = (120, 90, 60)
-                for i in range(4):
-                    y_offset = i * 16
-                    pygame.draw.line(screen, plank_color,
-                                   (screen_rect.x, screen_rect.y + y_offset),
-                                   (screen_rect.x + screen_rect.width, screen_rect.y + y_offset), 2)
-                
-                # Draw vertical wood grain details
-                for i in range(5):
-                    x_offset = i * 13
-                    pygame.draw.line(screen, plank_color,
-                                   (screen_rect.x + x_offset, screen_rect.y),
-                                   (screen_rect.x + x_offset, screen_rect.y + screen_rect.height), 1)
-                
-                # Draw nails/bolts at corners
-                nail_color = (80, 80, 80)
-                pygame.draw.circle(screen, nail_color,
-                                 (screen_rect.x + 8, screen_rect.y + 8), 3)
-                pygame.draw.circle(screen, nail_color,
-                                 (screen_rect.x + screen_rect.width - 8, screen_rect.y + 8), 3)
-                pygame.draw.circle(screen, nail_color,
-                                 (screen_rect.x + 8, screen_rect.y + screen_rect.height - 8), 3)
-                pygame.draw.circle(screen, nail_color,
-                                 (screen_rect.x + screen_rect.width - 8, screen_rect.y + screen_rect.height - 8), 3)
-                
-                # Draw border for temporary look
-                pygame.draw.rect(screen, (100, 70, 40), screen_rect, 2)
-
-        # Draw platform tiles (one-way platforms)
-        for rect in self.one_way_tiles:
-            screen_rect = pygame.Rect(rect.x - camera_x, rect.y - camera_y, rect.width, rect.height)
-            pygame.draw.rect(screen, (160, 82, 45), screen_rect)
-            pygame.draw.rect(screen, (101, 67, 33), screen_rect, 2)
+        # Draw the tiles in the on-screen columns from their pre-rendered images
+        # in one batched blit call
+        tile_size = self.tile_size
+        first_column = max(0, camera_x // tile_size)
+        last_column = min(self.cols, (camera_x + screen.get_width()) // tile_size + 1)
+        screen.blits([(image, (rect.x - camera_x, rect.y - camera_y))
+                      for column in self.tile_columns[first_column:last_column]
+                      for image, rect in column], doreturn=0)
 
-        # Draw exit door
+        # Draw exit door from its pre-rendered image
         if self.exit_rect:
-            screen_rect = pygame.Rect(self.exit_rect.x - camera_x, self.exit_rect.y - camera_y, 
-                                     self.exit_rect.width, self.exit_rect.height)
-            
-            # Check if all collectibles are collected
-            total = len(self.collectibles)
-            collected = sum(1 for it in self.collectibles if it['collected'])
-            all_collected = (total == 0) or (collected == total)
-            
-            # Draw door frame (dark wood)
-            pygame.draw.rect(screen, (101, 67, 33), screen_rect)
-            
-            # Draw door (lighter wood or locked gray)
-            door_inner = pygame.Rect(screen_rect.x + 4, screen_rect.y + 4, 
-                                    screen_rect.width - 8, screen_rect.height - 8)
-            if all_collected:
-                pygame.draw.rect(screen, (139, 90, 43), door_inner)  # Unlocked - brown
-            else:
-                pygame.draw.rect(screen, (100, 100, 100), door_inner)  # Locked - gray
-            
-            # Draw door handle
-            handle_x = screen_rect.x + screen_rect.width - 15
-            handle_y = screen_rect.y + screen_rect.height // 2
-            handle_color = (218, 165, 32) if all_collected else (150, 150, 150)
-            pygame.draw.circle(screen, handle_color, (handle_x, handle_y), 4)
-            
-            # Draw lock icon or "EXIT" text
-            font = pygame.font.Font(None, 24)
-            if all_collected:
-                text = font.render("EXIT", True, (255, 255, 255))
-            else:
-                # Draw lock symbol
-                text = font.render("LOCKED", True, (200, 200, 200))
-            text_rect = text.get_rect(center=(screen_rect.centerx, screen_rect.centery))
-            screen.blit(text, text_rect)
-        
-        # Draw collectibles (crystals)
-        for item in self.collectibles:
-            if item['collected']:
-                continue
-            rect = item['rect']
-            
-            # Draw crystal sprite if available
-            if self.crystal_sprite:
-                screen_x = rect.x - camera_x
-                screen_y = rect.y - camera_y
-                screen.blit(self.crystal_sprite, (screen_x, screen_y))
-            else:
-                # Fallback: Draw rhombus crystal
-                center_x = rect.centerx - camera_x
-                center_y = rect.centery - camera_y
-                half_w = rect.width // 2
-                half_h = rect.height // 2
-                
-                # Rhombus points: top, right, bottom, left
-                crystal_points = [
-                    (center_x, center_y - half_h),  # top
-                    (center_x + half_w, center_y),   # right
-                    (center_x, center_y + half_h),   # bottom
-                    (center_x - half_w, center_y)    # left
-                ]
-                # Draw filled crystal (cyan/light blue)
-                pygame.draw.polygon(screen, (0, 255, 255), crystal_points)
-                # Draw crystal outline (darker blue)
-                pygame.draw.polygon(screen, (0, 150, 200), crystal_points, 2)
-                # Add shine effect
-                shine_points = [
-                    (center_x - half_w // 3, center_y - half_h // 3),
-                    (center_x, center_y - half_h // 2),
-                    (center_x - half_w // 4, center_y)
-                ]
-                pygame.draw.polygon(screen, (200, 255, 255), shine_points)
+            image = self.get_exit_image(self.is_exit_unlocked())
+            offset_x, offset_y = self.exit_image_offset
+            screen.blit(image, (self.exit_rect.x + offset_x - camera_x,
+                                self.exit_rect.y + offset_y - camera_y))
+        
+        # Draw collectibles (crystals) in one batched blit call
+        image = self.crystal_image
+        offset_x = self.crystal_offset[0] - camera_x
+        offset_y = self.crystal_offset[1] - camera_y
+        screen.blits([(image, (item['rect'].x + offset_x, item['rect'].y + offset_y))
+                      for item in self.collectibles if not item['collected']], doreturn=0)
         
         # Draw enemy spawn points (for debugging/development)
         # Uncomment this section if you want to see spawn markers visually
@@ -530,6 +710,10 @@ class Level:
         """Return two lists: solid tiles and one-way tiles (platforms)."""
         return self.solid_tiles, self.one_way_tiles
     
+    def get_tile_grids(self):
+        """Return two spatial grids: solid tiles and one-way tiles (platforms)."""
+        return self.solid_grid, self.one_way_grid
+    
     def get_enemy_spawn_positions(self):
         """Return enemy spawn positions from CSV markers."""
         return self.enemy_spawns.copy()  # Return a copy to prevent external modification
@@ -538,11 +722,22 @@ class Level:
         """Return player spawn position if defined in level, otherwise None."""
         return self.player_spawn_point
     
+    def collect_items(self, rect):
+        """Mark every uncollected collectible touching rect as collected.
+        
+        Returns how many were picked up.
+        """
+        picked_up = 0
+        for item in self.collectibles:
+            if not item['collected'] and rect.colliderect(item['rect']):
+                item['collected'] = True
+                picked_up += 1
+        self.collected_count += picked_up
+        return picked_up
+    
     def is_exit_unlocked(self):
         """Check if all collectibles are collected to unlock the exit."""
-        total = len(self.collectibles)
-        collected = sum(1 for it in self.collectibles if it['collected'])
-        return (total == 0) or (collected == total)
+        return self.collected_count == len(self.collectibles)
     
     def get_highest_ground_y(self, x_position):
         """Get the Y position of the highest ground or platform near the given x position.
@@ -551,21 +746,19 @@ class Level:
         If no ground is found, returns a default value near the bottom of the level.
         """
         search_range = 200  # Search within 200 pixels horizontally
-        highest_y = self.height - 100  # Default fallback position
-        
-        # Check solid tiles (ground and dirt)
-        for rect in self.solid_tiles:
-            if abs(rect.centerx - x_position) <= search_range:
-                if rect.top < highest_y:
-                    highest_y = rect.top
+        default_y = self.height - 100  # Default fallback position
         
-        # Check one-way platforms
-        for rect in self.one_way_tiles:
-            if abs(rect.centerx - x_position) <= search_range:
-                if rect.top < highest_y:
-                    highest_y = rect.top
+        # Tiles sit on the column grid, so only the columns whose tile centers
+        # fall within the search range need checking (ceil/floor of the bounds)
+        tile_size = self.tile_size
+        half = tile_size // 2
+        first = max(0, math.ceil((x_position - search_range - half) / tile_size))
+        last = min(self.cols - 1, math.floor((x_position + search_range - half) / tile_size))
+        if first > last:
+            return default_y
         
-        return highest_y
+        # Entries already include the fallback, so a plain slice minimum is enough
+        return min(self.column_tops[first:last + 1])
     
     def get_level_number(self):
         """Return the current level number."""
@@ -7,7 +7,7 @@ import pygame
 import sys
 import random
 from player import Player
-from enemy import BasicEnemy, JumpingEnemy, AmbushEnemy, BossEnemy
+from enemy import Enemy, BasicEnemy, JumpingEnemy, AmbushEnemy, BossEnemy
 from level import Level
 from menu import MainMenu, LevelSelect
 from bullet import Bullet
@@ -25,10 +25,28 @@ class Game:
         self.screen = pygame.display.set_mode((self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
         pygame.display.set_caption("Echoes of Lyra")
         
+        # Render the shared bullet art up front so shooting never rasterizes it
+        Bullet.load_images()
+        
         # Clock for controlling frame rate
         self.clock = pygame.time.Clock()
         self.FPS = 60
         
+        # Dirty-rect display updates: when the camera and level are unchanged,
+        # only push the areas around moving sprites instead of flipping the whole
+        # screen. Falls back to flip() when the moving area gets too large.
+        self.USE_DIRTY_RECTS = True
+        self.DIRTY_AREA_LIMIT = 0.25  # Max fraction of the screen worth updating piecemeal
+        self.prev_dirty_rects = None  # Screen-space mover rects from the previous frame
+        self.prev_scene_key = None  # Camera/level state the previous frame was drawn with
+        self.prev_enemy_states = {}  # enemy -> (state, screen rect) as last drawn
+        
+        # Enemies further than this from the screen edges are not updated.
+        # A full screen on each side keeps every ambush detection/dash range
+        # (500px) inside the simulated area.
+        self.ENEMY_UPDATE_MARGIN_X = self.SCREEN_WIDTH
+        self.ENEMY_UPDATE_MARGIN_Y = self.SCREEN_HEIGHT
+        
         # Game state management
         self.running = True
         self.state = "main_menu"  # States: main_menu, level_select, playing, level_complete
@@ -49,8 +67,8 @@ class Game:
         # Game objects (initialized when level starts)
         self.level = None
         self.player = None
-        self.enemies = pygame.sprite.Group()
-        self.bullets = pygame.sprite.Group()
+        self.enemies = []  # plain list of Enemy objects
+        self.bullets = []  # plain list, compacted by Bullet.update_all each frame
 
         # Camera system
         self.camera_x = 0
@@ -65,15 +83,15 @@ class Game:
         """Spawn enemies based on CSV spawn markers."""
         spawn_positions = self.level.get_enemy_spawn_positions()
         
-        # Get tile information for ambush enemies
-        solid_tiles, one_way_tiles = self.level.get_platforms()
+        # Ambush enemies search the level's spatial grids for a tile to hang from
+        tile_grids = self.level.get_tile_grids()
         
         for spawn in spawn_positions:
             enemy_type = spawn.get('type', 'basic')  # Default to basic if type missing
             
             if enemy_type == 'ambush':
                 # AmbushEnemy needs tile information to find hanging position
-                enemy = AmbushEnemy(spawn['x'], spawn['y'], solid_tiles, one_way_tiles)
+                enemy = AmbushEnemy(spawn['x'], spawn['y'], tile_grids)
             elif enemy_type == 'jumping':
                 enemy = JumpingEnemy(spawn['x'], spawn['y'])
             elif enemy_type == 'boss':
@@ -81,7 +99,7 @@ class Game:
             else:  # basic or unknown types
                 enemy = BasicEnemy(spawn['x'], spawn['y'])
             
-            self.enemies.add(enemy)
+            self.enemies.append(enemy)
     
     def load_level(self, level_file, level_index):
         """Load a specific level."""
@@ -103,16 +121,20 @@ class Game:
         self.player = Player(start_x, start_y)
         
         # Clear and spawn enemies
-        self.enemies.empty()
+        self.enemies.clear()
         self.spawn_enemies()
         
         # Clear bullets
-        self.bullets.empty()
+        self.bullets.clear()
         
         # Reset camera
         self.camera_x = 0
         self.camera_y = 0
         
+        # Force a full display flip on the first frame
+        self.prev_dirty_rects = None
+        self.prev_enemy_states = {}
+        
         # Show controls for level 1
         if level_index == 0:
             self.show_controls = True
@@ -128,13 +150,8 @@ class Game:
     def check_level_complete(self):
         """Check if player has reached the exit door after collecting all items."""
         if self.level and self.level.exit_rect:
-            # Check if all collectibles are collected
-            total = len(self.level.collectibles)
-            collected = sum(1 for it in self.level.collectibles if it['collected'])
-            all_collected = (total == 0) or (collected == total)
-            
             # Only complete if all items collected AND player touches exit
-            if all_collected:
+            if self.level.is_exit_unlocked():
                 player_rect = self.player.get_rect()
                 return player_rect.colliderect(self.level.exit_rect)
         return False
@@ -174,7 +191,7 @@ class Game:
                     bullet_info = self.player.shoot()
                     if bullet_info:
                         bullet = Bullet(bullet_info['x'], bullet_info['y'], bullet_info['direction'])
-                        self.bullets.add(bullet)
+                        self.bullets.append(bullet)
             
             # Handle menu events
             if self.state == "main_menu":
@@ -221,42 +238,42 @@ class Game:
             # Get pressed keys for continuous input
             keys = pygame.key.get_pressed()
             
-            # Get platforms for collision detection (solid, one-way)
-            solid_tiles, one_way_tiles = self.level.get_platforms()
+            # Spatial grids over the level's solid and one-way tiles for collision lookups
+            solid_grid, one_way_grid = self.level.get_tile_grids()
 
             # Update player (pass level pixel bounds)
-            self.player.update(keys, solid_tiles, one_way_tiles, self.level.width, self.level.height)
+            self.player.update(keys, solid_grid, one_way_grid, self.level.width, self.level.height)
 
             # Update enemies
-            player_pos = self.player.get_position()
-            for enemy in self.enemies:
-                if isinstance(enemy, AmbushEnemy) or isinstance(enemy, BossEnemy):
-                    enemy.update(solid_tiles, one_way_tiles, self.level.height, self.level.width, player_pos)
-                else:
-                    enemy.update(solid_tiles, one_way_tiles, self.level.height, self.level.width)
+            active_area = pygame.Rect(self.camera_x, self.camera_y, self.SCREEN_WIDTH, self.SCREEN_HEIGHT).inflate(
+                2 * self.ENEMY_UPDATE_MARGIN_X, 2 * self.ENEMY_UPDATE_MARGIN_Y)
+            Enemy.update_all(self.enemies, solid_grid, one_way_grid,
+                             self.level.height, self.level.width, self.player.get_position(), active_area)
             
-            # Update bullets
-            for bullet in self.bullets:
-                bullet.update(self.level.width, self.level.height)
-                # Remove inactive bullets
-                if not bullet.active:
-                    self.bullets.remove(bullet)
+            # Update bullets and drop inactive ones in a single pass
+            self.bullets = Bullet.update_all(self.bullets, self.level.width, self.level.height)
             
-            # Check bullet-enemy collisions
+            # Check bullet-enemy collisions (Rect.collidelist scans the enemy rects in C)
+            live_enemies = [enemy for enemy in self.enemies if enemy.active]
+            enemy_rects = [enemy.get_rect() for enemy in live_enemies]
             for bullet in self.bullets:
                 if not bullet.active:
                     continue
-                bullet_rect = bullet.get_rect()
-                for enemy in self.enemies:
-                    if enemy.active and bullet_rect.colliderect(enemy.get_rect()):
-                        was_boss = isinstance(enemy, BossEnemy)
-                        enemy.take_damage(bullet.damage)
-                        bullet.hit()
+                index = bullet.get_rect().collidelist(enemy_rects)
+                if index != -1:
+                    enemy = live_enemies[index]
+                    was_boss = isinstance(enemy, BossEnemy)
+                    enemy.take_damage(bullet.damage)
+                    bullet.hit()
+                    
+                    if not enemy.active:
+                        # Dead enemies can't absorb later bullets this frame
+                        del live_enemies[index]
+                        del enemy_rects[index]
                         
                         # If boss was defeated, remove boss tiles
-                        if was_boss and not enemy.is_alive():
+                        if was_boss:
                             self.level.remove_boss_tiles()
-                        break
             
             # Update level
             self.level.update()
@@ -268,22 +285,22 @@ class Game:
                     self.player.take_damage(1)
                     break  # Only take damage from one enemy per frame
             
-            # Check boss bullet collisions with player
+            # Check boss bullet collisions with player. There is only one rect to
+            # test against, so a single C-level collidelist scan is the whole
+            # broad and narrow phase; the first bullet hit per boss counts
             for enemy in self.enemies:
                 if isinstance(enemy, BossEnemy) and enemy.active:
-                    boss_bullets = enemy.get_bullets()
-                    for boss_bullet in boss_bullets:
-                        if boss_bullet.active and player_rect.colliderect(boss_bullet.get_rect()):
-                            self.player.take_damage(boss_bullet.damage)
-                            boss_bullet.hit()
-                            break
+                    boss_bullets = [bullet for bullet in enemy.get_bullets() if bullet.active]
+                    index = player_rect.collidelist([bullet.rect for bullet in boss_bullets])
+                    if index != -1:
+                        boss_bullet = boss_bullets[index]
+                        self.player.take_damage(boss_bullet.damage)
+                        boss_bullet.hit()
 
             # Check collectible pickups
-            for item in self.level.collectibles:
-                if not item['collected'] and player_rect.colliderect(item['rect']):
-                    item['collected'] = True
-                    # You can add effects here (score/heal). For now, print and mark.
-                    print("Collected an item!")
+            for _ in range(self.level.collect_items(player_rect)):
+                # You can add effects here (score/heal). For now, print and mark.
+                print("Collected an item!")
             
             # Check if level is complete
             if self.check_level_complete() and not self.game_over:
@@ -306,6 +323,78 @@ class Game:
         self.camera_x = max(0, min(target_x, self.level.width - self.SCREEN_WIDTH))
         self.camera_y = max(0, min(target_y, self.level.height - self.SCREEN_HEIGHT))
 
+    def get_dirty_rects(self, total_crystals):
+        """Return screen-space rects covering everything that moves or changes this frame."""
+        camera_x, camera_y = self.camera_x, self.camera_y
+        
+        # HUD in the top-left corner (hearts, level name, crystals, indicators)
+        rects = [pygame.Rect(0, 0, max(190, 10 + 22 * total_crystals), 150)]
+        
+        # Player, widened for the bandana tie drawn beside the sprite
+        rects.append(self.player.rect.move(-camera_x, -camera_y).inflate(24, 4))
+        
+        # Enemies (plus room for the health bar above them) and boss bullets.
+        # An enemy that looks exactly as it did last frame needs no update; one
+        # that changed needs both its old and new areas, and one that just died
+        # needs its old area erased.
+        prev_states = self.prev_enemy_states
+        states = {}
+        for enemy in self.enemies:
+            if isinstance(enemy, BossEnemy) and enemy.active:
+                rects.extend(bullet.rect.move(-camera_x, -camera_y) for bullet in enemy.get_bullets())
+            prev_state, prev_rect = prev_states.get(enemy, (None, None))
+            if enemy.active:
+                # Screen position, so a camera move also counts as a change
+                screen_x = enemy.rect.x - camera_x
+                screen_y = enemy.rect.y - camera_y
+                state = (screen_x, screen_y, enemy.image, enemy.health)
+                if state == prev_state:
+                    states[enemy] = (state, prev_rect)
+                    continue
+                rect = self.get_enemy_drawn_rect(enemy, screen_x, screen_y)
+                states[enemy] = (state, rect)
+                rects.append(rect)
+            if prev_rect is not None:
+                # Erase exactly the area drawn last frame
+                rects.append(prev_rect)
+        self.prev_enemy_states = states
+        
+        # Player bullets
+        rects.extend(bullet.rect.move(-camera_x, -camera_y) for bullet in self.bullets if bullet.active)
+        return rects
+    
+    @staticmethod
+    def get_enemy_drawn_rect(enemy, x, y):
+        """Return the screen area of an enemy drawn at (x, y), health bar included.
+        
+        The health bar is as wide as the enemy's width, which can exceed its
+        rect (the boss), so the bar is measured rather than assumed.
+        """
+        bar_width = enemy.get_health_bar_image().get_width()
+        return pygame.Rect(x, y, enemy.rect.width, enemy.rect.height).union((x, y - 10, bar_width, 6))
+    
+    def present_playing_frame(self, total_crystals, collected_crystals):
+        """Push a gameplay frame to the display, using dirty rects when possible."""
+        overlay = self.game_over or (self.show_controls and not self.controls_acknowledged)
+        scene_key = (self.camera_x, self.camera_y, collected_crystals, self.level.boss_defeated)
+        dirty_rects = self.get_dirty_rects(total_crystals)
+        
+        # Only safe when last frame showed the same scene; the union of old and
+        # new rects erases where sprites were and shows where they are now
+        if (self.USE_DIRTY_RECTS and not overlay and self.prev_dirty_rects is not None
+                and scene_key == self.prev_scene_key):
+            update_rects = self.prev_dirty_rects + dirty_rects
+            dirty_area = sum(rect.width * rect.height for rect in update_rects)
+            if dirty_area < self.SCREEN_WIDTH * self.SCREEN_HEIGHT * self.DIRTY_AREA_LIMIT:
+                pygame.display.update(update_rects)
+                self.prev_dirty_rects = dirty_rects
+                return
+        
+        pygame.display.flip()
+        # Overlay frames cover the whole screen, so the next frame must flip again
+        self.prev_dirty_rects = None if overlay else dirty_rects
+        self.prev_scene_key = scene_key
+    
     def draw(self):
         """Draw all game objects to the screen."""
         if self.state == "main_menu":
@@ -323,18 +412,16 @@ class Game:
             
             # Draw player with camera offset (pass collectibles for crystal UI)
             total_crystals = len(self.level.collectibles)
-            collected_crystals = sum(1 for it in self.level.collectibles if it['collected'])
+            collected_crystals = self.level.collected_count
             self.player.draw(self.screen, self.camera_x, self.camera_y, total_crystals, collected_crystals)
             
-            # Draw enemies with camera offset
-            for enemy in self.enemies:
-                if enemy.active:
-                    enemy.draw(self.screen, self.camera_x, self.camera_y)
-            
-            # Draw bullets with camera offset
-            for bullet in self.bullets:
-                if bullet.active:
-                    bullet.draw(self.screen, self.camera_x, self.camera_y)
+            # Draw enemies (with health bars) and then bullets with camera offset,
+            # all in one batched blit call. Off-screen enemies are culled; the view
+            # reaches 10px below the screen for health bars drawn above their enemy.
+            view_rect = pygame.Rect(self.camera_x, self.camera_y, self.SCREEN_WIDTH, self.SCREEN_HEIGHT + 10)
+            blit_sequence = Enemy.get_all_blit_items(self.enemies, self.camera_x, self.camera_y, view_rect)
+            blit_sequence += Bullet.get_all_blit_items(self.bullets, self.camera_x, self.camera_y)
+            self.screen.blits(blit_sequence, doreturn=0)
             
             # Draw game over screen if needed
             if self.game_over:
@@ -348,11 +435,16 @@ class Game:
                 # Draw controls in level 1 if not acknowledged
                 if self.show_controls and not self.controls_acknowledged:
                     self.draw_controls()
+            
+            # Update display
+            self.present_playing_frame(total_crystals, collected_crystals)
+            return
         
         elif self.state == "level_complete":
             self.draw_level_complete()
         
-        # Update display
+        # Update display (menus always redraw the whole screen)
+        self.prev_dirty_rects = None
         pygame.display.flip()
     
     def draw_game_over(self):
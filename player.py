@@ -74,11 +74,11 @@ class Player(pygame.sprite.Sprite):
         self.left_key_was_pressed = False
         self.right_key_was_pressed = False
     
-    def update(self, keys, solid_tiles, one_way_tiles, level_width, level_height):
+    def update(self, keys, solid_grid, one_way_grid, level_width, level_height):
         """Update player position and state.
 
-        solid_tiles: list of Rect that are full solid (ground)
-        one_way_tiles: list of Rect that are one-way platforms (collide only when falling)
+        solid_grid: TileGrid over the full solid tiles (ground)
+        one_way_grid: TileGrid over the one-way platforms (collide only when falling)
         level_width/level_height: pixel bounds of the level for camera/clamp
         """
         current_time = pygame.time.get_ticks()
@@ -147,14 +147,19 @@ class Player(pygame.sprite.Sprite):
             if self.velocity_y > self.max_fall_speed:
                 self.velocity_y = self.max_fall_speed
         
-        # Move horizontally and check collisions
+        # Move horizontally and check collisions against the solid tiles the
+        # horizontal sweep touches (padded by a pixel for rounding)
+        sweep = self.rect.union(self.rect.move(self.velocity_x, 0)).inflate(2, 2)
         self.rect.x += self.velocity_x
         # horizontal collisions only against solid tiles (not platforms)
-        self.check_horizontal_collisions(solid_tiles)
+        self.check_horizontal_collisions(solid_grid.query(sweep))
 
-        # Move vertically and check collisions
+        # Move vertically and check collisions; the sweep is taken after the
+        # horizontal snap and padded for the 1px ground probe below the player
+        sweep = self.rect.union(self.rect.move(0, self.velocity_y)).inflate(2, 4)
         self.rect.y += self.velocity_y
-        self.check_vertical_collisions(solid_tiles, one_way_tiles, prev_rect, level_height)
+        self.check_vertical_collisions(solid_grid.query(sweep), one_way_grid.query(sweep),
+                                       prev_rect, level_height)
 
         # Keep player within level bounds horizontally and vertically
         self.rect.x = max(0, min(self.rect.x, level_width - self.width))
@@ -184,7 +189,10 @@ class Player(pygame.sprite.Sprite):
     
     def check_horizontal_collisions(self, tiles):
         """Check for horizontal collisions with solid tiles only (platforms have no horizontal collision)."""
-        for tile in tiles:
+        # Rect.collidelistall runs the overlap scan in C; only hits are resolved here
+        for index in self.rect.collidelistall(tiles):
+            tile = tiles[index]
+            # An earlier snap may already have pushed the player out of this tile
             if self.rect.colliderect(tile):
                 if self.velocity_x > 0:  # Moving right
                     self.rect.right = tile.left
@@ -200,27 +208,31 @@ class Player(pygame.sprite.Sprite):
         was_grounded = self.on_ground
         self.on_ground = False
 
-        # First check collisions with solid tiles
-        for tile in solid_tiles:
-            if self.rect.colliderect(tile):
-                if self.velocity_y > 0:  # falling
-                    self.rect.bottom = tile.top
-                    self.velocity_y = 0
-                    self.on_ground = True
-                    self.can_jump = True
-                elif self.velocity_y < 0:  # moving up
-                    self.rect.top = tile.bottom
-                    self.velocity_y = 0
+        # First check collisions with solid tiles. Only the first overlapping
+        # tile matters: resolving it zeroes velocity_y, so later hits are no-ops
+        index = self.rect.collidelist(solid_tiles)
+        if index != -1:
+            tile = solid_tiles[index]
+            if self.velocity_y > 0:  # falling
+                self.rect.bottom = tile.top
+                self.velocity_y = 0
+                self.on_ground = True
+                self.can_jump = True
+            elif self.velocity_y < 0:  # moving up
+                self.rect.top = tile.bottom
+                self.velocity_y = 0
 
         # Then check one-way platforms: only when falling and crossing from above
-        for tile in one_way_tiles:
-            if self.rect.colliderect(tile):
-                # Only if moving downwards and previous bottom was above the platform top
-                if self.velocity_y > 0 and prev_rect.bottom <= tile.top:
+        if self.velocity_y > 0:
+            for index in self.rect.collidelistall(one_way_tiles):
+                tile = one_way_tiles[index]
+                # Only if previous bottom was above the platform top
+                if prev_rect.bottom <= tile.top:
                     self.rect.bottom = tile.top
                     self.velocity_y = 0
                     self.on_ground = True
                     self.can_jump = True
+                    break  # Landed; velocity_y is 0 so no other platform applies
 
         # Clamp to level bottom
         if self.rect.bottom >= level_height:
@@ -233,21 +245,12 @@ class Player(pygame.sprite.Sprite):
         # This prevents flickering when standing still
         if self.velocity_y == 0 and was_grounded and not self.on_ground:
             # Do a quick check if there's ground below us (within 1 pixel)
-            test_rect = self.rect.copy()
-            test_rect.y += 1
-            
-            for tile in solid_tiles:
-                if test_rect.colliderect(tile):
-                    self.on_ground = True
-                    self.can_jump = True
-                    break
+            test_rect = self.rect.move(0, 1)
             
-            if not self.on_ground:
-                for tile in one_way_tiles:
-                    if test_rect.colliderect(tile):
-                        self.on_ground = True
-                        self.can_jump = True
-                        break
+            if (test_rect.collidelist(solid_tiles) != -1 or
+                    test_rect.collidelist(one_way_tiles) != -1):
+                self.on_ground = True
+                self.can_jump = True
         
         # Update last grounded time when touching ground
         if self.on_ground: